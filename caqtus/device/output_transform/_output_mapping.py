@@ -130,7 +130,7 @@ def interpolate[
     ).to_base_units()
 
     output_magnitude = np.interp(
-        x=values.to_unit(base_input_values.units).magnitude,
+        x=values.m_as(base_input_values.units),
         xp=base_input_values.magnitude,
         fp=base_output_values.magnitude,
     )
@@ -140,7 +140,7 @@ def _evaluate_in_nanoseconds(
     if not is_scalar_quantity(evaluated):
         raise InvalidValueError("Advance must be a scalar quantity.")
     try:
-        evaluated_advance = evaluated.to_unit(NANOSECOND).magnitude
+        evaluated_advance = evaluated.m_as(NANOSECOND)
     except DimensionalityError as e:
         raise InvalidDimensionalityError(
             f"Advance must be expressed in seconds, not {evaluated.units}"
@@ -18,7 +18,7 @@ from caqtus.shot_compilation.timed_instructions import (
 )
 from caqtus.types.expression import Expression
 from caqtus.types.recoverable_exceptions import InvalidTypeError, InvalidValueError
-from caqtus.types.units import Unit, Quantity, InvalidDimensionalityError
+from caqtus.types.units import Quantity, InvalidDimensionalityError, SECOND
 from caqtus.types.variable_name import DottedVariableName
 from ..channel_output import ChannelOutput
 from ...timing import TimeStep, ns
@@ -66,12 +66,12 @@ class BroadenLeft(ChannelOutput):
                 f"Width {fmt.expression(self.width)} does not evaluate to a quantity, "
                 f"got {fmt.type_(type(width))}"
             )
-        if not width.is_compatible_with(Unit("s")):
+        if not width.is_compatible_with(SECOND):
             raise InvalidDimensionalityError(
                 f"Width {fmt.expression(self.width)} does not have units of time, got "
                 f"{fmt.unit(width.units)}"
             )
-        seconds = width.to(Unit("s")).magnitude
+        seconds = width.m_as(SECOND)
         if seconds < 0:
             raise InvalidValueError(
                 f"Width {fmt.expression(self.width)} evaluates to a negative value"
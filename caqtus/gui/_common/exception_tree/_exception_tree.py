@@ -20,17 +20,16 @@ def create_exception_tree(
     exception_item.setForeground(1, error_color)
     result.append(exception_item)
     if tb_summary.notes:
-        for note in tb_summary.notes:
-            note_item = QTreeWidgetItem(exception_item, ["", "", note])
-            exception_item.addChild(note_item)
+        exception_item.addChildren(
+            [QTreeWidgetItem(None, ["", "", note]) for note in tb_summary.notes]  # type: ignore
+        )
     if tb_summary.exceptions:
         for i, child_exception in enumerate(tb_summary.exceptions):
             exception_item.addChildren(
                 create_exception_tree(child_exception, f"Sub-error {i}")
             )
     if tb_summary.cause:
-        for cause in create_exception_tree(tb_summary.cause, "because:"):
-            exception_item.addChild(cause)
+        exception_item.addChildren(create_exception_tree(tb_summary.cause, "because:"))
     return result
 
 
@@ -21,9 +21,12 @@ class ExceptionDialog(QtWidgets.QDialog, Ui_ExceptionDialog):
             tree = create_exception_tree(tb_summary)
             self.exception_tree.addTopLevelItems(tree)
         self.exception_tree.expandAll()
-        for column in range(self.exception_tree.columnCount()):
-            self.exception_tree.resizeColumnToContents(column)
         self.exception_tree.hideColumn(1)
+        # Resizing a column requires measuring the text of every item, so we skip
+        # the columns that are not displayed.
+        for column in range(self.exception_tree.columnCount()):
+            if not self.exception_tree.isColumnHidden(column):
+                self.exception_tree.resizeColumnToContents(column)
         self.setWindowTitle("Error")
 
     def set_message(self, message: str):
@@ -39,6 +39,7 @@ from caqtus.session._sequence_collection import SequenceStats
 from caqtus.types.iteration import (
     Unknown,
     IterationConfiguration,
+    is_unknown,
 )
 from caqtus.types.timelane import TimeLanes
 from caqtus.utils.result import (
@@ -91,7 +92,10 @@ class AsyncPathHierarchyModel(QAbstractItemModel):
         self.session_maker = session_maker
 
         self.tree = QStandardItemModel(self)
-        self.tree.invisibleRootItem().setData(
+        # index and parent are called very often by the views, so the root item is
+        # kept here instead of being fetched from the tree each time.
+        self._root_item = self.tree.invisibleRootItem()
+        self._root_item.setData(
             FolderNode(
                 path=PureSequencePath.root(),
                 has_fetched_children=False,
@@ -106,11 +110,7 @@ class AsyncPathHierarchyModel(QAbstractItemModel):
     ):
         if not self.hasIndex(row, column, parent):
             return QModelIndex()
-        parent_item = (
-            parent.internalPointer()
-            if parent.isValid()
-            else self.tree.invisibleRootItem()
-        )
+        parent_item = parent.internalPointer() if parent.isValid() else self._root_item
         child_item = parent_item.child(row)
         return (
             self.createIndex(row, column, child_item) if child_item else QModelIndex()
@@ -127,7 +127,7 @@ class AsyncPathHierarchyModel(QAbstractItemModel):
             return QModelIndex()
         return (
             self.createIndex(parent_item.row(), 0, parent_item)
-            if parent_item is not self.tree.invisibleRootItem()
+            if parent_item is not self._root_item
             else QModelIndex()
         )
 
@@ -216,11 +216,7 @@ class AsyncPathHierarchyModel(QAbstractItemModel):
         return True
 
     def _get_item(self, index) -> QStandardItem:
-        result = (
-            index.internalPointer()
-            if index.isValid()
-            else self.tree.invisibleRootItem()
-        )
+        result = index.internalPointer() if index.isValid() else self._root_item
         assert isinstance(result, QStandardItem)
         return result
 
@@ -293,34 +289,30 @@ class AsyncPathHierarchyModel(QAbstractItemModel):
     def _build_item(
         path: PureSequencePath, session: ExperimentSession
     ) -> QStandardItem:
-        assert session.paths.does_path_exists(path)
         item = QStandardItem()
         item.setData(path.name, Qt.ItemDataRole.DisplayRole)
-        is_sequence_result = session.sequences.is_sequence(path)
-        assert not is_failure_type(is_sequence_result, PathNotFoundError)
-        is_sequence = is_sequence_result.value
         creation_date_result = session.paths.get_path_creation_date(path)
         assert not is_failure_type(creation_date_result, PathNotFoundError)
         assert not is_failure_type(creation_date_result, PathIsRootError)
         creation_date = creation_date_result.value
-        if is_sequence:
-            stats_result = session.sequences.get_stats(path)
-            assert not is_failure_type(stats_result, PathNotFoundError)
-            assert not is_failure_type(stats_result, PathIsNotSequenceError)
-            stats = stats_result.value
+        # Querying the stats directly tells us if the path is a sequence, without
+        # having to check it beforehand.
+        stats_result = session.sequences.get_stats(path)
+        assert not is_failure_type(stats_result, PathNotFoundError)
+        if is_failure_type(stats_result, PathIsNotSequenceError):
             item.setData(
-                SequenceNode(
-                    path=path,
-                    stats=stats,
-                    creation_date=creation_date,
-                    last_query_time=get_update_date(),
+                FolderNode(
+                    path=path, has_fetched_children=False, creation_date=creation_date
                 ),
                 NODE_DATA_ROLE,
             )
         else:
             item.setData(
-                FolderNode(
-                    path=path, has_fetched_children=False, creation_date=creation_date
+                SequenceNode(
+                    path=path,
+                    stats=stats_result.value,
+                    creation_date=creation_date,
+                    last_query_time=get_update_date(),
                 ),
                 NODE_DATA_ROLE,
             )
@@ -330,34 +322,30 @@ class AsyncPathHierarchyModel(QAbstractItemModel):
     async def _build_item_async(
         path: PureSequencePath, session: AsyncExperimentSession
     ) -> QStandardItem:
-        assert await session.paths.does_path_exists(path)
         item = QStandardItem()
         item.setData(path.name, Qt.ItemDataRole.DisplayRole)
-        is_sequence_result = await session.sequences.is_sequence(path)
-        assert not is_failure_type(is_sequence_result, PathNotFoundError)
-        is_sequence = is_sequence_result.value
         creation_date_result = await session.paths.get_path_creation_date(path)
         assert not is_failure_type(creation_date_result, PathNotFoundError)
         assert not is_failure_type(creation_date_result, PathIsRootError)
         creation_date = creation_date_result.value
-        if is_sequence:
-            stats_result = await session.sequences.get_stats(path)
-            assert not is_failure_type(stats_result, PathNotFoundError)
-            assert not is_failure_type(stats_result, PathIsNotSequenceError)
-            stats = stats_result.value
+        # Querying the stats directly tells us if the path is a sequence, without
+        # having to check it beforehand.
+        stats_result = await session.sequences.get_stats(path)
+        assert not is_failure_type(stats_result, PathNotFoundError)
+        if is_failure_type(stats_result, PathIsNotSequenceError):
             item.setData(
-                SequenceNode(
-                    path=path,
-                    stats=stats,
-                    creation_date=creation_date,
-                    last_query_time=get_update_date(),
+                FolderNode(
+                    path=path, has_fetched_children=False, creation_date=creation_date
                 ),
                 NODE_DATA_ROLE,
             )
         else:
             item.setData(
-                FolderNode(
-                    path=path, has_fetched_children=False, creation_date=creation_date
+                SequenceNode(
+                    path=path,
+                    stats=stats_result.value,
+                    creation_date=creation_date,
+                    last_query_time=get_update_date(),
                 ),
                 NODE_DATA_ROLE,
             )
@@ -444,72 +432,109 @@ class AsyncPathHierarchyModel(QAbstractItemModel):
             await self.update_from_session()
 
     async def update_from_session(self) -> None:
-        await self.prune()
-        await self.add_new_paths()
-        for row in range(self.rowCount()):
-            await self.update_stats(self.index(row, 0))
+        # A single session is used to update the whole tree, instead of opening a new
+        # one for each node.
+        async with self.session_maker.async_session() as session:
+            await self._prune(DEFAULT_INDEX, session)
+            await self._add_new_paths(DEFAULT_INDEX, session)
+            await self._update_children_stats(DEFAULT_INDEX, session)
 
     async def update_stats(self, index: QModelIndex) -> None:
         """Update the stats of sequences and folders in the model from the session."""
 
+        async with self.session_maker.async_session() as session:
+            if await self._update_stats(index, session):
+                self._emit_rows_changed(index.parent(), [index.row()])
+
+    async def _update_stats(
+        self, index: QModelIndex, session: AsyncExperimentSession
+    ) -> bool:
+        """Update the stats of the item at the given index and of its descendants.
+
+        Returns:
+            True if the data of the item itself changed.
+            The caller is responsible for emitting dataChanged for it, while changes
+            of the descendants are signaled by this method.
+        """
+
         if not index.isValid():
             # This situation occurs sometimes, but unsure why.
             # Maybe if fetch is called in the middle of an async call?
-            return None
+            return False
 
         item = self._get_item(index)
         data = get_item_data(item)
         change_detected = False
-        async with self.session_maker.async_session() as session:
-            creation_date_result = await session.paths.get_path_creation_date(data.path)
-            assert not is_failure_type(creation_date_result, PathIsRootError)
-            if is_failure_type(creation_date_result, PathNotFoundError):
-                await self.handle_path_was_deleted_async(index)
-                return
-            creation_date = creation_date_result.value
-            if creation_date != data.creation_date:
+        creation_date_result = await session.paths.get_path_creation_date(data.path)
+        assert not is_failure_type(creation_date_result, PathIsRootError)
+        if is_failure_type(creation_date_result, PathNotFoundError):
+            await self.handle_path_was_deleted_async(index)
+            return False
+        creation_date = creation_date_result.value
+        if creation_date != data.creation_date:
+            await anyio.lowlevel.checkpoint()
+            data.creation_date = creation_date
+            change_detected = True
+        if isinstance(data, SequenceNode):
+            sequence_stats_result = await session.sequences.get_stats(data.path)
+            assert not is_failure_type(sequence_stats_result, PathNotFoundError)
+            if is_failure_type(sequence_stats_result, PathIsNotSequenceError):
+                await self.handle_sequence_became_folder(index, session)
+                return False
+            stats = sequence_stats_result.value
+            if _stats_changed(data.stats, stats):
                 await anyio.lowlevel.checkpoint()
-                data.creation_date = creation_date
+                data.stats = stats
+                data.last_query_time = get_update_date()
                 change_detected = True
-            if isinstance(data, SequenceNode):
-                sequence_stats_result = await session.sequences.get_stats(data.path)
-                assert not is_failure_type(sequence_stats_result, PathNotFoundError)
-                if is_failure_type(sequence_stats_result, PathIsNotSequenceError):
-                    await self.handle_sequence_became_folder(index, session)
-                    return
-                stats = sequence_stats_result.value
-                if stats != data.stats:
-                    await anyio.lowlevel.checkpoint()
-                    data.stats = stats
-                    data.last_query_time = get_update_date()
-                    change_detected = True
-        if change_detected:
-            top_left = index.siblingAtColumn(0)
-            bottom_right = index.siblingAtColumn(self.columnCount() - 1)
-            self.dataChanged.emit(top_left, bottom_right, [Qt.ItemDataRole.DisplayRole])
         if isinstance(data, FolderNode):
-            for row in range(item.rowCount()):
-                await self.update_stats(self.index(row, 0, index))
+            await self._update_children_stats(index, session)
+        return change_detected
+
+    async def _update_children_stats(
+        self, parent: QModelIndex, session: AsyncExperimentSession
+    ) -> None:
+        changed_rows = []
+        for row in range(self.rowCount(parent)):
+            if await self._update_stats(self.index(row, 0, parent), session):
+                changed_rows.append(row)
+        self._emit_rows_changed(parent, changed_rows)
+
+    def _emit_rows_changed(self, parent: QModelIndex, rows: list[int]) -> None:
+        # A single signal is emitted for all the rows that changed under the same
+        # parent, so that the view repaints them in one pass instead of once per row.
+        # Rows might have been removed while the stats were being updated.
+        rows = [row for row in rows if row < self.rowCount(parent)]
+        if not rows:
+            return
+        top_left = self.index(min(rows), 0, parent)
+        bottom_right = self.index(max(rows), self.columnCount() - 1, parent)
+        self.dataChanged.emit(top_left, bottom_right, [Qt.ItemDataRole.DisplayRole])
 
     async def prune(self, parent: QModelIndex = DEFAULT_INDEX) -> None:
         """Removes children of the parent that are no longer present in the session."""
 
+        async with self.session_maker.async_session() as session:
+            await self._prune(parent, session)
+
+    async def _prune(
+        self, parent: QModelIndex, session: AsyncExperimentSession
+    ) -> None:
         parent_item = self._get_item(parent)
         parent_data = get_item_data(parent_item)
 
         if isinstance(parent_data, SequenceNode):
             return
 
-        async with self.session_maker.async_session() as session:
-            children_result = await session.paths.get_children(parent_data.path)
-            await anyio.lowlevel.checkpoint()
-            if is_failure_type(children_result, PathIsSequenceError):
-                await self.handle_folder_became_sequence_async(parent, session)
-                return
-            elif is_failure_type(children_result, PathNotFoundError):
-                await self.handle_path_was_deleted_async(parent)
-                return
-            child_paths = children_result.value
+        children_result = await session.paths.get_children(parent_data.path)
+        await anyio.lowlevel.checkpoint()
+        if is_failure_type(children_result, PathIsSequenceError):
+            await self.handle_folder_became_sequence_async(parent, session)
+            return
+        elif is_failure_type(children_result, PathNotFoundError):
+            await self.handle_path_was_deleted_async(parent)
+            return
+        child_paths = children_result.value
 
         await anyio.lowlevel.checkpoint()
         # Need to use persistent indices to avoid invalidation while removing rows.
@@ -529,11 +554,17 @@ class AsyncPathHierarchyModel(QAbstractItemModel):
                 remaining_children.add(child)
 
         for child in remaining_children:
-            await self.prune(QModelIndex(child))
+            await self._prune(QModelIndex(child), session)
 
     async def add_new_paths(self, parent: QModelIndex = DEFAULT_INDEX) -> None:
         """Add new paths to the model that have been added to the session."""
 
+        async with self.session_maker.async_session() as session:
+            await self._add_new_paths(parent, session)
+
+    async def _add_new_paths(
+        self, parent: QModelIndex, session: AsyncExperimentSession
+    ) -> None:
         parent_item = self._get_item(parent)
         parent_data = get_item_data(parent_item)
         match parent_data:
@@ -542,27 +573,25 @@ class AsyncPathHierarchyModel(QAbstractItemModel):
             case FolderNode(has_fetched_children=False):
                 return
             case FolderNode(path=parent_path, has_fetched_children=True):
-                async with self.session_maker.async_session() as session:
-                    children_result = await session.paths.get_children(parent_path)
-                    if is_failure_type(children_result, PathIsSequenceError):
-                        await self.handle_folder_became_sequence_async(parent, session)
-                        return
-                    elif is_failure_type(children_result, PathNotFoundError):
-                        await self.handle_path_was_deleted_async(parent)
-                        return
-                    child_paths = children_result.value
-                    already_added_paths = {
-                        get_item_data(parent_item.child(row)).path
-                        for row in range(parent_item.rowCount())
-                    }
-                    new_paths = child_paths - already_added_paths
-                    new_items = [
-                        await self._build_item_async(path, session)
-                        for path in new_paths
-                    ]
-                    await self.append_items(parent, new_items)
+                children_result = await session.paths.get_children(parent_path)
+                if is_failure_type(children_result, PathIsSequenceError):
+                    await self.handle_folder_became_sequence_async(parent, session)
+                    return
+                elif is_failure_type(children_result, PathNotFoundError):
+                    await self.handle_path_was_deleted_async(parent)
+                    return
+                child_paths = children_result.value
+                already_added_paths = {
+                    get_item_data(parent_item.child(row)).path
+                    for row in range(parent_item.rowCount())
+                }
+                new_paths = child_paths - already_added_paths
+                new_items = [
+                    await self._build_item_async(path, session) for path in new_paths
+                ]
+                await self.append_items(parent, new_items)
                 for row in range(self.rowCount(parent)):
-                    await self.add_new_paths(self.index(row, 0, parent))
+                    await self._add_new_paths(self.index(row, 0, parent), session)
 
     async def append_items(
         self, parent: QModelIndex, items: list[QStandardItem]
@@ -741,6 +770,48 @@ class AsyncPathHierarchyModel(QAbstractItemModel):
             self.endInsertRows()
             return creation_result
 
+    def create_new_folder(
+        self, parent: QModelIndex, name: str
+    ) -> Success[None] | Failure[PathIsSequenceError]:
+        """Create a new folder inside the folder at the given index.
+
+        The new folder is appended to the children of the parent, without reloading
+        the other children.
+        """
+
+        parent_item = self._get_item(parent)
+        parent_data = get_item_data(parent_item)
+        if not isinstance(parent_data, FolderNode):
+            raise ValueError("Parent must be a folder")
+        new_path = parent_data.path / name
+        with self.session_maker() as session, self._background_runner.suspend():
+            creation_result = session.paths.create_path(new_path)
+            if is_failure(creation_result):
+                return creation_result
+            # If the children of the parent have not been fetched yet, the new folder
+            # will be loaded with the others when the parent is expanded.
+            if (
+                creation_result.value != [new_path]
+                or not parent_data.has_fetched_children
+            ):
+                return Success(None)
+            creation_date_result = session.paths.get_path_creation_date(new_path)
+            assert not is_failure(creation_date_result)
+            item = QStandardItem()
+            item.setData(name, Qt.ItemDataRole.DisplayRole)
+            item.setData(
+                FolderNode(
+                    path=new_path,
+                    has_fetched_children=True,
+                    creation_date=creation_date_result.value,
+                ),
+                NODE_DATA_ROLE,
+            )
+            self.beginInsertRows(parent, parent_item.rowCount(), parent_item.rowCount())
+            parent_item.appendRow(item)
+            self.endInsertRows()
+            return Success(None)
+
     def remove_path(
         self, index: QModelIndex
     ) -> (
@@ -769,6 +840,15 @@ class AsyncPathHierarchyModel(QAbstractItemModel):
                 return result
 
 
+def _stats_changed(old: SequenceStats, new: SequenceStats) -> bool:
+    # Two unknown number of shots never compare equal, so without this special case,
+    # the stats of such sequences would always be considered changed and their rows
+    # would be repainted after every query.
+    if is_unknown(old.expected_number_shots) and is_unknown(new.expected_number_shots):
+        return attrs.evolve(old, expected_number_shots=new.expected_number_shots) != new
+    return old != new
+
+
 def format_duration(stats: SequenceStats, updated_time: datetime.datetime) -> str:
     if stats.state == State.DRAFT or stats.state == State.PREPARING:
         return "--/--"
@@ -1,6 +1,5 @@
 from collections.abc import Callable
 
-import qtawesome
 from PySide6.QtGui import QFontDatabase
 from PySide6.QtWidgets import QApplication
 
@@ -53,6 +52,8 @@ class Condetrol:
             self.app = app
         self.app.setOrganizationName("Caqtus")
         self.app.setApplicationName("Condetrol")
+        import qtawesome
+
         self.app.setWindowIcon(qtawesome.icon("mdi6.cactus", size=64, color="green"))  # type: ignore[reportAttributeAccessIssue]
         self.app.setStyle("Fusion")  # type: ignore[reportAttributeAccessIssue]
 
@@ -1,5 +1,23 @@
-import qtawesome
-from PySide6.QtGui import QIcon, QPalette
+import functools
+
+from PySide6.QtGui import QIcon, QPalette, QColor
+
+_ICON_IDS = {
+    "camera": "mdi6.camera-outline",
+    "editable-sequence": "mdi6.pencil-outline",
+    "read-only-sequence": "mdi6.pencil-off-outline",
+    "start": "mdi6.play",
+    "stop": "mdi6.stop",
+    "delete": "mdi6.delete",
+    "duplicate": "mdi6.content-duplicate",
+    "clear": "mdi6.database-remove",
+    "plus": "mdi6.plus",
+    "minus": "mdi6.minus",
+    "copy": "mdi6.content-copy",
+    "paste": "mdi6.content-paste",
+    "simplify-timelanes": "mdi6.table-merge-cells",
+    "add-time-lane": "mdi6.table-row-plus-after",
+}
 
 
 def get_icon(name: str, color=None) -> QIcon:
@@ -10,25 +28,17 @@ def get_icon(name: str, color=None) -> QIcon:
         color: The color of the icon. If None, the default color is used.
     """
 
-    ids = {
-        "camera": "mdi6.camera-outline",
-        "editable-sequence": "mdi6.pencil-outline",
-        "read-only-sequence": "mdi6.pencil-off-outline",
-        "start": "mdi6.play",
-        "stop": "mdi6.stop",
-        "delete": "mdi6.delete",
-        "duplicate": "mdi6.content-duplicate",
-        "clear": "mdi6.database-remove",
-        "plus": "mdi6.plus",
-        "minus": "mdi6.minus",
-        "copy": "mdi6.content-copy",
-        "paste": "mdi6.content-paste",
-        "simplify-timelanes": "mdi6.table-merge-cells",
-        "add-time-lane": "mdi6.table-row-plus-after",
-    }
     if color is None:
         color = QPalette().buttonText().color()
-    if name in ids:
-        name = ids[name]
-    icon = qtawesome.icon(name, color=color)
-    return icon
+    return _get_icon(_ICON_IDS.get(name, name), QColor(color).rgba())
+
+
+@functools.cache
+def _get_icon(name: str, rgba: int) -> QIcon:
+    # Icons are requested each time a widget or a context menu is created, so they
+    # are built once for each name and color and then shared.
+    # qtawesome is slow to import, so it is only loaded when an icon is requested,
+    # and not when the GUI package is imported.
+    import qtawesome
+
+    return qtawesome.icon(name, color=QColor.fromRgba(rgba))
@@ -4,7 +4,7 @@ import contextlib
 import functools
 import math
 import platform
-from collections.abc import Callable, Awaitable
+from collections.abc import Callable, Awaitable, Mapping, MutableMapping
 from typing import Never
 
 import anyio
@@ -14,6 +14,7 @@ from PySide6 import QtGui, QtCore, QtWidgets
 from PySide6.QtCore import Qt
 
 from caqtus.__about__ import __version__
+from caqtus.device import DeviceConfiguration, DeviceName
 from caqtus.experiment_control.manager import ExperimentManager, Procedure
 from caqtus.session import ExperimentSessionMaker, PureSequencePath, TracebackSummary
 from caqtus.types.parameter import ParameterNamespace
@@ -38,6 +39,9 @@ from ..._common.exception_tree import ExceptionDialog
 from ..._common.waiting_widget import run_with_wip_widget
 from ...qtutil import temporary_widget
 
+_WINDOW_STATE_KEY = f"{__name__}/state"
+_WINDOW_GEOMETRY_KEY = f"{__name__}/geometry"
+
 
 class CondetrolWindowHandler:
     def __init__(
@@ -248,16 +252,11 @@ class CondetrolMainWindow(QtWidgets.QMainWindow, Ui_CondetrolMainWindow):
                 self.device_configurations_dialog.get_device_configurations()
             )
             with self.session_maker() as session:
-                for device_name in session.default_device_configurations:
-                    if device_name not in new_device_configurations:
-                        del session.default_device_configurations[device_name]
-                for (
-                    device_name,
-                    device_configuration,
-                ) in new_device_configurations.items():
-                    session.default_device_configurations[device_name] = (
-                        device_configuration
-                    )
+                _save_device_configurations(
+                    session.default_device_configurations,
+                    previous_device_configurations,
+                    new_device_configurations,
+                )
 
     def closeEvent(self, event):  # noqa: N802
         self.save_window()
@@ -265,19 +264,19 @@ class CondetrolMainWindow(QtWidgets.QMainWindow, Ui_CondetrolMainWindow):
 
     def restore_window(self) -> None:
         ui_settings = QtCore.QSettings()
-        state = ui_settings.value(f"{__name__}/state", defaultValue=None)
+        state = ui_settings.value(_WINDOW_STATE_KEY, defaultValue=None)
         if state is not None:
             assert isinstance(state, QtCore.QByteArray)
             self.restoreState(state)
-        geometry = ui_settings.value(f"{__name__}/geometry", defaultValue=None)
+        geometry = ui_settings.value(_WINDOW_GEOMETRY_KEY, defaultValue=None)
         if geometry is not None:
             assert isinstance(geometry, QtCore.QByteArray)
             self.restoreGeometry(geometry)
 
     def save_window(self) -> None:
         ui_settings = QtCore.QSettings()
-        ui_settings.setValue(f"{__name__}/state", self.saveState())
-        ui_settings.setValue(f"{__name__}/geometry", self.saveGeometry())
+        ui_settings.setValue(_WINDOW_STATE_KEY, self.saveState())
+        ui_settings.setValue(_WINDOW_GEOMETRY_KEY, self.saveGeometry())
 
     def display_error(self, message: str, exception: TracebackSummary):
         with temporary_widget(ExceptionDialog(self)) as exception_dialog:
@@ -324,6 +323,44 @@ class CondetrolMainWindow(QtWidgets.QMainWindow, Ui_CondetrolMainWindow):
         )
 
 
+def _save_device_configurations(
+    stored: MutableMapping[DeviceName, DeviceConfiguration],
+    previous: Mapping[DeviceName, DeviceConfiguration],
+    new: Mapping[DeviceName, DeviceConfiguration],
+) -> None:
+    """Write the configurations edited by the user to the storage.
+
+    Args:
+        stored: The configurations in the storage, to be updated.
+        previous: The configurations that were loaded into the editor.
+        new: The configurations the editor returned.
+    """
+
+    for device_name in list(stored):
+        if device_name not in new:
+            del stored[device_name]
+    for device_name, device_configuration in new.items():
+        # Writing a configuration is a round trip to the storage, so we skip the ones
+        # that were not edited.
+        if _is_unchanged(previous.get(device_name), device_configuration):
+            continue
+        stored[device_name] = device_configuration
+
+
+def _is_unchanged(
+    previous: DeviceConfiguration | None, new: DeviceConfiguration
+) -> bool:
+    if previous is None:
+        return False
+    # Configurations can be defined by plugins, and their equality is not always
+    # well-behaved, for example it raises for array fields.
+    # When in doubt, we consider the configuration changed and write it again.
+    try:
+        return bool(previous == new)
+    except Exception:
+        return False
+
+
 class BackgroundTask:
     def __init__[
         **P
@@ -88,7 +88,7 @@ class EditablePathHierarchyView(AsyncPathHierarchyView):
 
                 create_folder_action = new_menu.addAction("folder")
                 create_folder_action.triggered.connect(
-                    functools.partial(self.create_new_folder, path)
+                    functools.partial(self.create_new_folder, index)
                 )
 
                 create_sequence_action = new_menu.addAction("sequence")
@@ -283,18 +283,37 @@ class EditablePathHierarchyView(AsyncPathHierarchyView):
                 return
             assert_never(creation_result)
 
-    def create_new_folder(self, path: PureSequencePath):
+    def create_new_folder(self, parent: QModelIndex):
+        path = self._model.get_path(parent)
+        title = f"New folder in {path}..."
         text, ok = QInputDialog().getText(
             self,
-            f"New folder in {path}...",
+            title,
             "Folder name:",
             QLineEdit.EchoMode.Normal,
             "new folder",
         )
-        if ok and text:
-            new_path = path / text
-            with self.session_maker() as session:
-                session.paths.create_path(new_path)
+        if not (ok and text):
+            return
+        if not PureSequencePath.is_valid_name(text):
+            QMessageBox.warning(  # type: ignore[reportCallIssue]
+                self,
+                title,
+                f"Name '{text}' is not valid for a folder.",
+            )
+            return
+        creation_result = self._model.create_new_folder(parent, text)
+        if is_success(creation_result):
+            return
+        elif is_failure_type(creation_result, PathIsSequenceError):
+            QMessageBox.warning(  # type: ignore[reportCallIssue]
+                self,
+                title,
+                f"Can't create <i>{text}</i> because it or one of its ancestors is "
+                f"a sequence.",
+            )
+            return
+        assert_never(creation_result)
 
     def create_new_sequence(self, parent: QModelIndex):
         path = self._model.get_path(parent)
@@ -46,6 +46,14 @@ NAME_COLOR = "#AA4926"
 VALUE_COLOR = "#6897BB"
 HIGHLIGHT_COLOR = "#cc7832"
 
+# The colors of the sub-widgets are set by a single style sheet on the compound
+# widget, so that it is parsed once per editor instead of once per sub-widget.
+_COMPOUND_WIDGET_STYLE_SHEET = (
+    f"#keyword {{ color: {HIGHLIGHT_COLOR} }} "
+    f"#name {{ color: {NAME_COLOR} }} "
+    f"#value {{ color: {VALUE_COLOR} }}"
+)
+
 
 class StepDelegate(HTMLItemDelegate):
     # ruff: noqa: N802
@@ -142,6 +150,7 @@ class CompoundWidget(QWidget):
         self._layout.setSpacing(0)
         self.setLayout(self._layout)
         self._widgets = []
+        self.setStyleSheet(_COMPOUND_WIDGET_STYLE_SHEET)
 
     def add_widget(self, widget: QWidget):
         self._layout.addWidget(widget)
@@ -164,35 +173,35 @@ class LinspaceLoopEditor(CompoundWidget):
         self.setFont(font)
         for_label = QLabel("for ", self)
         for_label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        for_label.setStyleSheet(f"color: {HIGHLIGHT_COLOR}")
+        for_label.setObjectName("keyword")
         self.add_widget(for_label)
         self.name_editor = AutoResizeLineEdit(self)
-        self.name_editor.setStyleSheet(f"color: {NAME_COLOR}")
+        self.name_editor.setObjectName("name")
         self.add_widget(self.name_editor)
         equal_label = QLabel(" = ", self)
         equal_label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
         self.add_widget(equal_label)
         self.start_editor = AutoResizeLineEdit(self)
-        self.start_editor.setStyleSheet(f"color: {VALUE_COLOR}")
+        self.start_editor.setObjectName("value")
         self.add_widget(self.start_editor)
         to_label = QLabel(" to ", self)
         to_label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        to_label.setStyleSheet(f"color: {HIGHLIGHT_COLOR}")
+        to_label.setObjectName("keyword")
         self.add_widget(to_label)
         self.stop_editor = AutoResizeLineEdit(self)
-        self.stop_editor.setStyleSheet(f"color: {VALUE_COLOR}")
+        self.stop_editor.setObjectName("value")
         self.add_widget(self.stop_editor)
         with_label = QLabel(" with ", self)
         with_label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        with_label.setStyleSheet(f"color: {HIGHLIGHT_COLOR}")
+        with_label.setObjectName("keyword")
         self.add_widget(with_label)
         self.num_editor = QSpinBox(self)
-        self.num_editor.setStyleSheet(f"color: {VALUE_COLOR}")
+        self.num_editor.setObjectName("value")
         self.num_editor.setRange(0, 9999)
         self.add_widget(self.num_editor)
         steps_label = QLabel(" steps:", self)
         steps_label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        steps_label.setStyleSheet(f"color: {HIGHLIGHT_COLOR}")
+        steps_label.setObjectName("keyword")
         self.add_widget(steps_label)
         layout = self.layout()
         assert isinstance(layout, QHBoxLayout)
@@ -240,8 +249,8 @@ class VariableDeclarationEditor(CompoundWidget):
         palette.setColor(QPalette.ColorRole.Window, Qt.GlobalColor.black)
         self.setAutoFillBackground(True)
         self.setPalette(palette)
-        self.name_editor.setStyleSheet(f"color: {NAME_COLOR}")
-        self.value_editor.setStyleSheet(f"color: {VALUE_COLOR}")
+        self.name_editor.setObjectName("name")
+        self.value_editor.setObjectName("value")
         self.name_editor.setPlaceholderText("Parameter name")
         self.value_editor.setPlaceholderText("Parameter value")
 
@@ -265,34 +274,34 @@ class ArrangeLoopEditor(CompoundWidget):
         self.setFont(font)
         for_label = QLabel("for ", self)
         for_label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        for_label.setStyleSheet(f"color: {HIGHLIGHT_COLOR}")
+        for_label.setObjectName("keyword")
         self.add_widget(for_label)
         self.name_editor = AutoResizeLineEdit(self)
-        self.name_editor.setStyleSheet(f"color: {NAME_COLOR}")
+        self.name_editor.setObjectName("name")
         self.add_widget(self.name_editor)
         equal_label = QLabel(" = ", self)
         equal_label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
         self.add_widget(equal_label)
         self.start_editor = AutoResizeLineEdit(self)
-        self.start_editor.setStyleSheet(f"color: {VALUE_COLOR}")
+        self.start_editor.setObjectName("value")
         self.add_widget(self.start_editor)
         to_label = QLabel(" to ", self)
         to_label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        to_label.setStyleSheet(f"color: {HIGHLIGHT_COLOR}")
+        to_label.setObjectName("keyword")
         self.add_widget(to_label)
         self.stop_editor = AutoResizeLineEdit(self)
-        self.stop_editor.setStyleSheet(f"color: {VALUE_COLOR}")
+        self.stop_editor.setObjectName("value")
         self.add_widget(self.stop_editor)
         with_label = QLabel(" with ", self)
         with_label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        with_label.setStyleSheet(f"color: {HIGHLIGHT_COLOR}")
+        with_label.setObjectName("keyword")
         self.add_widget(with_label)
         self.step_editor = AutoResizeLineEdit(self)
-        self.step_editor.setStyleSheet(f"color: {VALUE_COLOR}")
+        self.step_editor.setObjectName("value")
         self.add_widget(self.step_editor)
         spacing_label = QLabel(" spacing:", self)
         spacing_label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        spacing_label.setStyleSheet(f"color: {HIGHLIGHT_COLOR}")
+        spacing_label.setObjectName("keyword")
         self.add_widget(spacing_label)
         layout = self.layout()
         assert isinstance(layout, QHBoxLayout)
@@ -29,6 +29,7 @@ from .delegate import StepDelegate
 from .steps_model import StepsModel
 from ..sequence_iteration_editor import SequenceIterationEditor
 from ..._icons import get_icon
+from ..._yaml import YAML_LOADER, YAML_DUMPER
 
 
 def create_shot_step() -> ExecuteShot:
@@ -201,8 +202,14 @@ class StepsIterationEditor(QTreeView, SequenceIterationEditor[StepsConfiguration
         This method does not emit the signal iteration_edited.
         """
 
-        self._model.set_steps(iteration)
-        self.expandAll()
+        # The model reset collapses every item, so we hold off repainting until
+        # the tree has been expanded again to avoid drawing it collapsed first.
+        self.setUpdatesEnabled(False)
+        try:
+            self._model.set_steps(iteration)
+            self.expandAll()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def set_available_parameter_names(self, parameter_names: Set[DottedVariableName]):
         """Sets the names that can be used in the iteration.
@@ -320,7 +327,7 @@ class StepsIterationEditor(QTreeView, SequenceIterationEditor[StepsConfiguration
             steps, StepsConfiguration
         )
 
-        text = yaml.safe_dump(unstructured)
+        text = yaml.dump(unstructured, Dumper=YAML_DUMPER)
         clipboard = QGuiApplication.clipboard()
         clipboard.setText(text)
 
@@ -336,7 +343,7 @@ class StepsIterationEditor(QTreeView, SequenceIterationEditor[StepsConfiguration
         clipboard = QGuiApplication.clipboard()
         text = clipboard.text()
         try:
-            data = yaml.safe_load(text)
+            data = yaml.load(text, Loader=YAML_LOADER)
         except yaml.YAMLError as e:
             QtWidgets.QMessageBox.warning(  # type: ignore[reportCallIssue]
                 self,
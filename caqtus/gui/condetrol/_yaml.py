@@ -0,0 +1,6 @@
+import yaml
+
+# Copied steps and time lanes can be large, so the C implementation of the YAML
+# loader and dumper is used when pyyaml was built with it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
@@ -192,7 +192,9 @@ class DeviceEditorDelegate(QStyledItemDelegate):
 
     def setModelData(self, editor, model, index):
         assert isinstance(editor, DeviceConfigurationEditor)
-        config = copy.deepcopy(editor.get_configuration())
+        # get_configuration already returns a new configuration that is not shared
+        # with the editor, so there is no need to copy it again.
+        config = editor.get_configuration()
         model.setData(index, config, _CONFIG_ROLE)
 
     def updateEditorGeometry(self, editor, option, index):
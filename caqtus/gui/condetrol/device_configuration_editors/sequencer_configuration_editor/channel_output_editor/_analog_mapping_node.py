@@ -1,3 +1,4 @@
+import functools
 from collections.abc import Sequence
 from typing import Optional
 
@@ -15,6 +16,7 @@ from PySide6.QtCore import (
     QSortFilterProxyModel,
     QModelIndex,
     QPointF,
+    QTimer,
 )
 from PySide6.QtGui import QPainter
 from PySide6.QtWidgets import (
@@ -29,7 +31,6 @@ from caqtus.device.output_transform._output_mapping import interpolate
 from caqtus.gui._common.NodeGraphQt import BaseNode, NodeBaseWidget
 from caqtus.gui.condetrol._icons import get_icon
 from caqtus.types.units import Unit, Quantity, dimensionless
-from caqtus.utils.itertools import pairwise
 from .calibrated_analog_mapping_widget_ui import Ui_CalibratedAnalogMappingWigdet
 
 _QMODEL_INDEX = QModelIndex()
@@ -105,7 +106,7 @@ class CalibratedAnalogMappingWidget(QWidget, Ui_CalibratedAnalogMappingWigdet):
         self.remove_button.clicked.connect(self.on_remove_button_clicked)
 
         delegate = QStyledItemDelegate(self)
-        delegate.setItemEditorFactory(ItemEditorFactory())
+        delegate.setItemEditorFactory(_get_item_editor_factory())
         self.tableView.setItemDelegate(delegate)
 
         self._chart = QChart()
@@ -113,10 +114,17 @@ class CalibratedAnalogMappingWidget(QWidget, Ui_CalibratedAnalogMappingWigdet):
         self._series = QLineSeries()
         self._series.setName("Values")
 
-        self._model.dataChanged.connect(self._update_series)
-        self._model.rowsInserted.connect(self._update_series)
-        self._model.rowsRemoved.connect(self._update_series)
-        self._model.modelReset.connect(self._update_series)
+        # Recomputing the curve is expensive, so updates requested during the same
+        # event loop iteration are coalesced into a single one.
+        self._series_update_timer = QTimer(self)
+        self._series_update_timer.setSingleShot(True)
+        self._series_update_timer.setInterval(0)
+        self._series_update_timer.timeout.connect(self._update_series)
+
+        self._model.dataChanged.connect(self._schedule_series_update)
+        self._model.rowsInserted.connect(self._schedule_series_update)
+        self._model.rowsRemoved.connect(self._schedule_series_update)
+        self._model.modelReset.connect(self._schedule_series_update)
         self._chart.addSeries(self._series)
 
         self.x_axis = QValueAxis()
@@ -138,28 +146,29 @@ class CalibratedAnalogMappingWidget(QWidget, Ui_CalibratedAnalogMappingWigdet):
         self.tabWidget.insertTab(0, self._chartView, "Curve")
         self.tabWidget.setCurrentIndex(0)
 
+    def _schedule_series_update(self) -> None:
+        self._series_update_timer.start()
+
     def _update_series(self):
-        self._series.clear()
-        number_points = self._sorted_model.rowCount()
-        if number_points == 0:
+        values = self._model.get_values()
+        if not values:
+            self._series.clear()
             return
-        x_points = []
-        y_points = []
-        for row in range(number_points):
-            x_points.append(self._sorted_model.data(self._sorted_model.index(row, 0)))
-            y_points.append(self._sorted_model.data(self._sorted_model.index(row, 1)))
+        x_points, y_points = np.asarray(values, dtype=np.float64).T
         input_units = Unit(u) if (u := self.input_units()) else dimensionless
         calibration_input_points = Quantity(x_points, input_units)
         output_units = Unit(u) if (u := self.output_units()) else dimensionless
         calibration_output_points = Quantity(y_points, output_units)
 
         if len(x_points) >= 2:
-            input_points = np.concat(
-                [np.linspace(a, b, 50) for a, b in pairwise(x_points)]
-            )
+            # Each row contains the points sampled between two consecutive calibration
+            # points.
+            input_magnitudes = np.linspace(
+                x_points[:-1], x_points[1:], 50, axis=1
+            ).ravel()
         else:
-            input_points = x_points
-        input_points = Quantity(input_points, input_units)
+            input_magnitudes = x_points
+        input_points = Quantity(input_magnitudes, input_units)
         output_points = interpolate(  # type: ignore[reportCallIssue]
             input_points,  # type: ignore[reportArgumentType]
             calibration_input_points,
@@ -169,10 +178,14 @@ class CalibratedAnalogMappingWidget(QWidget, Ui_CalibratedAnalogMappingWigdet):
         new_points = [
             QPointF(x, y)
             for x, y in zip(
-                input_points.magnitude, output_points.magnitude, strict=True
+                input_magnitudes.tolist(),
+                np.asarray(output_points.magnitude).tolist(),
+                strict=True,
             )
         ]
-        self._series.append(new_points)
+        # Replacing all points at once only triggers a single update of the chart,
+        # while clearing and appending would trigger one for each operation.
+        self._series.replace(new_points)
         self.auto_scale()
 
     def set_data_points(self, values: Sequence[tuple[float, float]]) -> None:
@@ -187,7 +200,7 @@ class CalibratedAnalogMappingWidget(QWidget, Ui_CalibratedAnalogMappingWigdet):
             # where the input_units is an empty string.
             self.inputUnitLineEdit.clear()
             self.x_axis.setTitleText("Input")
-        self._update_series()
+        self._schedule_series_update()
 
     def set_output_units(self, output_units: Optional[str]) -> None:
         if output_units:
@@ -198,7 +211,7 @@ class CalibratedAnalogMappingWidget(QWidget, Ui_CalibratedAnalogMappingWigdet):
             # where the input_units is an empty string.
             self.outputUnitLineEdit.clear()
             self.y_axis.setTitleText("Output")
-        self._update_series()
+        self._schedule_series_update()
 
     def set_units(
         self, input_units: Optional[str], output_units: Optional[str]
@@ -277,11 +290,13 @@ class Model(QAbstractTableModel):
     def get_values(self) -> list[tuple[float, float]]:
         return sorted(self._values)
 
-    def x_range(self):
-        return min(x for x, _ in self._values), max(x for x, _ in self._values)
+    def x_range(self) -> tuple[float, float]:
+        x_values = [x for x, _ in self._values]
+        return min(x_values), max(x_values)
 
-    def y_range(self):
-        return min(y for _, y in self._values), max(y for _, y in self._values)
+    def y_range(self) -> tuple[float, float]:
+        y_values = [y for _, y in self._values]
+        return min(y_values), max(y_values)
 
     def flags(self, index):
         return (
@@ -301,19 +316,29 @@ class Model(QAbstractTableModel):
                 return str(section)
         return None
 
-    def insertRow(
-        self, row, parent: QModelIndex | QPersistentModelIndex = _QMODEL_INDEX
-    ):
-        self.beginInsertRows(parent, row, row)
-        self._values.insert(row, (0.0, 0.0))
+    def insertRows(
+        self,
+        row: int,
+        count: int,
+        parent: QModelIndex | QPersistentModelIndex = _QMODEL_INDEX,
+    ) -> bool:
+        if count < 1 or not (0 <= row <= len(self._values)):
+            return False
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._values[row:row] = [(0.0, 0.0)] * count
         self.endInsertRows()
         return True
 
-    def removeRow(
-        self, row, parent: QModelIndex | QPersistentModelIndex = _QMODEL_INDEX
-    ):
-        self.beginRemoveRows(parent, row, row)
-        del self._values[row]
+    def removeRows(
+        self,
+        row: int,
+        count: int,
+        parent: QModelIndex | QPersistentModelIndex = _QMODEL_INDEX,
+    ) -> bool:
+        if count < 1 or row < 0 or row + count > len(self._values):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._values[row : row + count]
         self.endRemoveRows()
         return True
 
@@ -331,3 +356,12 @@ class ItemEditorFactory(QItemEditorFactory):
             return spin_box
         else:
             return super().createEditor(userType, parent)
+
+
+@functools.cache
+def _get_item_editor_factory() -> ItemEditorFactory:
+    # The factory holds no state, so a single instance is shared by all the mapping
+    # widgets.
+    # It also needs to be kept alive as long as the delegates using it, since the
+    # delegates don't take ownership of it.
+    return ItemEditorFactory()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import functools
 from typing import Optional, Any
 
 from PySide6.QtCore import (
@@ -16,6 +17,15 @@ from caqtus.types.timelane import TimeLane
 from ._time_lane_model import TimeLaneModel
 
 
+@functools.cache
+def _lane_settings() -> QSettings:
+    # A lane model is created for each lane every time a sequence is displayed, so
+    # we reuse a single settings object instead of opening the underlying storage
+    # for each of them.
+    # It is created on first use, once the application name has been set.
+    return QSettings()
+
+
 class ColoredTimeLaneModel[L: TimeLane](TimeLaneModel[L], metaclass=qabc.QABCMeta):
     """A time lane model that can be colored.
 
@@ -35,7 +45,7 @@ class ColoredTimeLaneModel[L: TimeLane](TimeLaneModel[L], metaclass=qabc.QABCMet
         super().__init__(name, lane, parent)
         self._brush: Optional[QBrush] = None
 
-        color = QSettings().value(f"lane color/{self.name()}", None)
+        color = _lane_settings().value(f"lane color/{self.name()}", None)
         if color is not None:
             self._brush = QBrush(color)
         else:
@@ -87,13 +97,11 @@ class ColoredTimeLaneModel[L: TimeLane](TimeLaneModel[L], metaclass=qabc.QABCMet
         ):
             if isinstance(value, QColor):
                 self._brush = QBrush(value)
-                settings = QSettings()
-                settings.setValue(f"lane color/{self.name()}", value)
+                _lane_settings().setValue(f"lane color/{self.name()}", value)
                 change = True
             elif value is None:
                 self._brush = None
-                settings = QSettings()
-                settings.remove(f"lane color/{self.name()}")
+                _lane_settings().remove(f"lane color/{self.name()}")
                 change = True
         if change:
             self.headerDataChanged.emit(orientation, section, section)
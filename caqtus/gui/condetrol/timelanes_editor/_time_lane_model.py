@@ -465,11 +465,12 @@ class TimeLaneModel[L: TimeLane](QAbstractListModel, metaclass=qabc.QABCMeta):
             self.model.set_lane(self.lane)
 
     def _simplify_without_undo(self) -> None:
-        self.beginResetModel()
+        # Merging blocks keeps the number of steps, so only the values and spans of
+        # existing rows change and there is no need to reset the model.
         start = 0
         for i in range(1, len(self.__lane)):
             if self.__lane[i] != self.__lane[start]:
                 self.__lane[start:i] = self.__lane[start]
                 start = i
         self.__lane[start:] = self.__lane[start]
-        self.endResetModel()
+        self.dataChanged.emit(self.index(0), self.index(len(self.__lane) - 1))
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import itertools
 from typing import Optional
 
 import yaml
-from PySide6.QtCore import Qt, QModelIndex, QRect
+from PySide6.QtCore import Qt, QModelIndex, QRect, QTimer
 from PySide6.QtGui import QAction, QFont, QUndoStack, QCursor
 from PySide6.QtWidgets import (
     QTableView,
@@ -19,6 +18,7 @@ from PySide6.QtWidgets import (
 
 from caqtus.device import DeviceConfiguration, DeviceName
 from caqtus.gui.condetrol._icons import get_icon
+from caqtus.gui.condetrol._yaml import YAML_LOADER, YAML_DUMPER
 from caqtus.gui.qtutil import block_signals, temporary_widget
 from caqtus.types.timelane import TimeLanes, TimeLane
 from ._delegate import TimeLaneDelegate
@@ -146,7 +146,7 @@ class TimeLanesEditor(QWidget):
         time_lanes = self.view.get_time_lanes()
         unstructured = self._extension.unstructure_time_lanes(time_lanes)
 
-        text = yaml.safe_dump(unstructured)
+        text = yaml.dump(unstructured, Dumper=YAML_DUMPER)
         clipboard = QApplication.clipboard()
         clipboard.setText(text)
 
@@ -163,7 +163,7 @@ class TimeLanesEditor(QWidget):
         clipboard = QApplication.clipboard()
         text = clipboard.text()
         try:
-            content = yaml.safe_load(text)
+            content = yaml.load(text, Loader=YAML_LOADER)
         except yaml.YAMLError as e:
             QMessageBox.warning(  # type: ignore[reportCallIssue]
                 self,
@@ -305,6 +305,14 @@ class TimeLanesView(QTableView):
             Qt.ContextMenuPolicy.CustomContextMenu
         )
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+
+        # Changes to the model often come in bursts of signals, so the spans are
+        # recomputed once after the burst, and only when the view is visible.
+        self._spans_update_timer = QTimer(self)
+        self._spans_update_timer.setSingleShot(True)
+        self._spans_update_timer.setInterval(0)
+        self._spans_update_timer.timeout.connect(self._on_spans_update_timeout)
+        self._spans_outdated = False
         self.setup_connections()
 
         # self.setSelectionBehavior(QTableView.SelectionBehavior.SelectItems)
@@ -372,23 +380,29 @@ class TimeLanesView(QTableView):
         self._model.modelReset.connect(self.on_time_lanes_changed)
 
         # only need to update the lane delegates when the rows change
-        self._model.rowsInserted.connect(self.update_delegates)
-        self._model.rowsRemoved.connect(self.update_delegates)
+        self._model.rowsInserted.connect(self._on_rows_inserted_or_removed)
+        self._model.rowsRemoved.connect(self._on_rows_inserted_or_removed)
         self._model.modelReset.connect(self.update_delegates)
 
     def on_time_lanes_changed(self):
-        self.update_spans()
+        self._spans_update_timer.start()
+
+    def _on_spans_update_timeout(self) -> None:
+        if self.isVisible():
+            self.update_spans()
+        else:
+            self._spans_outdated = True
+
+    def showEvent(self, event):  # noqa: N802
+        if self._spans_outdated:
+            self.update_spans()
+        super().showEvent(event)
 
     def on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex):
+        # Changing the value of a cell can merge or split blocks beyond the changed
+        # range, so all the spans are recomputed.
         self.on_time_lanes_changed()
 
-        for row in range(top_left.row(), bottom_right.row() + 1):
-            for column in range(top_left.column(), bottom_right.column() + 1):
-                index = self._model.index(row, column, QModelIndex())
-                span = self._model.span(index)
-                if span.width() >= 1 or span.height() >= 1:
-                    self.setSpan(row, column, span.height(), span.width())
-
     def get_time_lanes(self) -> TimeLanes:
         return self._model.get_timelanes()
 
@@ -396,21 +410,38 @@ class TimeLanesView(QTableView):
         self._model.set_timelanes(time_lanes)
 
     def update_spans(self):
+        self._spans_outdated = False
         self.clearSpans()
+        column_count = self._model.columnCount()
         for row in range(self._model.rowCount()):
-            for column in range(self._model.columnCount()):
-                index = self._model.index(row, column, QModelIndex())
-                span = self._model.span(index)
-                if span.width() >= 1 or span.height() >= 1:
+            index = self._model.index(row, 0)
+            column = 0
+            while column < column_count:
+                span = self._model.span(index.siblingAtColumn(column))
+                # After clearing the spans, all cells span a single cell, so only
+                # the cells that start a larger block need to be updated.
+                if span.width() > 1 or span.height() > 1:
                     self.setSpan(row, column, span.height(), span.width())
+                # The cells covered by a block don't start a block themselves, so
+                # we jump directly to the next block.
+                column += max(span.width(), 1)
 
-    def update_delegates(self):
-        for row in range(self._model.rowCount()):
+    def _on_rows_inserted_or_removed(
+        self, parent: QModelIndex, first: int, last: int
+    ) -> None:
+        # Delegates are attached to row numbers, so only the rows at or after the
+        # change are shifted and need a new delegate.
+        self.update_delegates(first)
+
+    def update_delegates(self, first_row: int = 0) -> None:
+        """Recreate the lane delegates for the rows starting at `first_row`."""
+
+        for row in range(first_row, self._model.rowCount()):
             previous_delegate = self.itemDelegateForRow(row)
             if previous_delegate:
                 previous_delegate.deleteLater()
             self.setItemDelegateForRow(row, None)  # type: ignore[reportArgumentType]
-        for row in range(2, self._model.rowCount()):
+        for row in range(max(2, first_row), self._model.rowCount()):
             lane = self._model.get_lane(row - 2)
             name = self._model.get_lane_name(row - 2)
             delegate = self._construct_delegate(lane, name)
@@ -518,21 +549,18 @@ class TimeLanesView(QTableView):
             menu.exec(self.viewport().mapToGlobal(pos))
 
     def expand_step(self, step: int, selection):
-        indices: set[tuple[int, int]] = set()
+        # Only the first and last selected columns of each row are needed, so they
+        # are computed from the selection ranges without enumerating every cell.
+        columns_per_row: dict[int, tuple[int, int]] = {}
         for selection_range in selection:
-            top_left = selection_range.topLeft()
-            bottom_right = selection_range.bottomRight()
-            indices.update(
-                itertools.product(
-                    range(top_left.row(), bottom_right.row() + 1),
-                    range(top_left.column(), bottom_right.column() + 1),
-                )
-            )
-
-        for row, group in itertools.groupby(sorted(indices), key=lambda x: x[0]):
-            group = list(group)
-            start = group[0][1]
-            stop = group[-1][1]
+            left = selection_range.left()
+            right = selection_range.right()
+            for row in range(selection_range.top(), selection_range.bottom() + 1):
+                start, stop = columns_per_row.get(row, (left, right))
+                columns_per_row[row] = (min(start, left), max(stop, right))
+
+        for row in sorted(columns_per_row):
+            start, stop = columns_per_row[row]
             self._model.expand_step(step, row - 2, start, stop)
 
     def add_lane(self, lane_name: str, lane: TimeLane):
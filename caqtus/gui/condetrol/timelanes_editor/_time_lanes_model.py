@@ -52,6 +52,9 @@ class TimeLanesModel(QAbstractTableModel):
         self._step_names_model = TimeStepNameModel(self.undo_stack, self)
         self._step_durations_model = TimeStepDurationModel(self.undo_stack, self)
         self._lane_models: list[TimeLaneModel] = []
+        # Maps each lane model to its position in _lane_models.
+        # It is rebuilt lazily after lanes are inserted or removed.
+        self._lane_indices: Optional[dict[TimeLaneModel, int]] = None
         self._extension = extension
 
         self._step_names_model.dataChanged.connect(self._on_step_names_data_changed)
@@ -139,6 +142,7 @@ class TimeLanesModel(QAbstractTableModel):
         self._step_durations_model.set_durations(timelanes.step_durations)
         self._lane_models.clear()
         self._lane_models.extend(new_models)
+        self._lane_indices = None
         self.endResetModel()
 
     def set_timelanes_with_undo(self, timelanes: TimeLanes, message: str) -> bool:
@@ -182,6 +186,7 @@ class TimeLanesModel(QAbstractTableModel):
             self.model._step_durations_model.set_durations(self.new_durations)
             self.model._lane_models.clear()
             self.model._lane_models.extend(self.new_models)
+            self.model._lane_indices = None
             self.model.endResetModel()
 
         def undo(self):
@@ -190,6 +195,7 @@ class TimeLanesModel(QAbstractTableModel):
             self.model._step_durations_model.set_durations(self.old_durations)
             self.model._lane_models.clear()
             self.model._lane_models.extend(self.old_models)
+            self.model._lane_indices = None
             self.model.endResetModel()
 
     def _create_lane_model(self, name: str, lane: TimeLane) -> TimeLaneModel:
@@ -215,7 +221,7 @@ class TimeLanesModel(QAbstractTableModel):
         return lane_model
 
     def _on_lane_model_reset(self, lane_model: TimeLaneModel):
-        lane_index = self._lane_models.index(lane_model)
+        lane_index = self._get_lane_index(lane_model)
         self.dataChanged.emit(
             self.index(lane_index + 2, 0),
             self.index(lane_index + 2, self.columnCount() - 1),
@@ -227,7 +233,7 @@ class TimeLanesModel(QAbstractTableModel):
         bottom_right: QModelIndex,
         lane_model: TimeLaneModel,
     ):
-        lane_index = self._lane_models.index(lane_model)
+        lane_index = self._get_lane_index(lane_model)
         self.dataChanged.emit(
             self.index(lane_index + 2, top_left.row()),
             self.index(lane_index + 2, bottom_right.row()),
@@ -240,7 +246,7 @@ class TimeLanesModel(QAbstractTableModel):
         last: int,
         lane_model: TimeLaneModel,
     ):
-        lane_index = self._lane_models.index(lane_model)
+        lane_index = self._get_lane_index(lane_model)
         if orientation == Qt.Orientation.Horizontal:
             self.headerDataChanged.emit(
                 Qt.Orientation.Vertical,
@@ -248,6 +254,13 @@ class TimeLanesModel(QAbstractTableModel):
                 lane_index + 2,
             )
 
+    def _get_lane_index(self, lane_model: TimeLaneModel) -> int:
+        if self._lane_indices is None:
+            self._lane_indices = {
+                model: index for index, model in enumerate(self._lane_models)
+            }
+        return self._lane_indices[lane_model]
+
     def get_lane(self, index: int) -> TimeLane:
         return self._lane_models[index].get_lane()
 
@@ -269,7 +282,9 @@ class TimeLanesModel(QAbstractTableModel):
     def columnCount(
         self, parent: QModelIndex | QPersistentModelIndex = _DEFAULT_MODEL_INDEX
     ) -> int:
-        return self.number_steps()
+        # This is called very often by the view, so we skip the consistency check
+        # done in number_steps.
+        return self._step_names_model.rowCount()
 
     def rowCount(
         self, parent: QModelIndex | QPersistentModelIndex = _DEFAULT_MODEL_INDEX
@@ -547,6 +562,7 @@ class TimeLanesModel(QAbstractTableModel):
         assert 0 <= index <= self.lane_number()
         self.beginInsertRows(QModelIndex(), index + 2, index + 2)
         self._lane_models.insert(index, lane_model)
+        self._lane_indices = None
         self.endInsertRows()
 
     def remove_lane(self, lane_index: int) -> bool:
@@ -583,6 +599,7 @@ class TimeLanesModel(QAbstractTableModel):
         assert 0 <= lane_index < len(self._lane_models)
         self.beginRemoveRows(QModelIndex(), lane_index + 2, lane_index + 2)
         model = self._lane_models.pop(lane_index)
+        self._lane_indices = None
         self.endRemoveRows()
         return model
 
@@ -625,14 +642,18 @@ class TimeLanesModel(QAbstractTableModel):
         return lane_model.expand_step(step, start, stop)
 
     def _map_to_source(self, index: QModelIndex | QPersistentModelIndex) -> QModelIndex:
+        # This is called for every cell each time the view is painted, so we avoid
+        # checking the bounds of the index with hasIndex, as it would call back
+        # rowCount and columnCount.
         assert index.isValid()
-        assert self.hasIndex(index.row(), index.column())
-        if index.row() == 0:
-            return self._step_names_model.index(index.column(), 0)
-        elif index.row() == 1:
-            return self._step_durations_model.index(index.column(), 0)
+        row = index.row()
+        column = index.column()
+        if row == 0:
+            return self._step_names_model.index(column, 0)
+        elif row == 1:
+            return self._step_durations_model.index(column, 0)
         else:
-            return self._lane_models[index.row() - 2].index(index.column(), 0)
+            return self._lane_models[row - 2].index(column, 0)
 
     def simplify(self) -> bool:
         if self._read_only:
@@ -3,7 +3,6 @@
 # ruff: noqa: N802
 from __future__ import annotations
 
-import copy
 from typing import Optional
 
 import attrs
@@ -29,13 +28,13 @@ class TimeStepNameModel(QAbstractListModel):
 
     def set_names(self, names: list[str]):
         self.beginResetModel()
-        self._names = copy.deepcopy(names)
+        self._names = list(names)
         self.endResetModel()
 
     def get_names(self) -> list[str]:
         """Return a copy of the names displayed in the model."""
 
-        return copy.deepcopy(self._names)
+        return list(self._names)
 
     def rowCount(
         self, parent: QModelIndex | QPersistentModelIndex = _DEFAULT_INDEX
@@ -169,11 +168,11 @@ class TimeStepDurationModel(QAbstractListModel):
 
     def set_durations(self, durations: list[Expression]):
         self.beginResetModel()
-        self._durations = copy.deepcopy(durations)
+        self._durations = list(durations)
         self.endResetModel()
 
     def get_duration(self) -> list[Expression]:
-        return copy.deepcopy(self._durations)
+        return list(self._durations)
 
     def rowCount(
         self, parent: QModelIndex | QPersistentModelIndex = _DEFAULT_INDEX
@@ -10,6 +10,8 @@ from .._colored_time_lane_model import ColoredTimeLaneModel
 
 _DEFAULT_INDEX = QModelIndex()
 
+_VALUE_ROLES = frozenset({Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole})
+
 
 class AnalogTimeLaneModel(ColoredTimeLaneModel[AnalogTimeLane]):
     # ruff: noqa: N802
@@ -20,6 +22,10 @@ class AnalogTimeLaneModel(ColoredTimeLaneModel[AnalogTimeLane]):
     def data(self, index, role: int = Qt.ItemDataRole.DisplayRole):
         if not index.isValid():
             return None
+        if role not in _VALUE_ROLES:
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+            return super().data(index, role)
         value = self.lane_value(index.row())
         if role == Qt.ItemDataRole.DisplayRole:
             if isinstance(value, Expression):
@@ -32,10 +38,6 @@ class AnalogTimeLaneModel(ColoredTimeLaneModel[AnalogTimeLane]):
             if isinstance(value, Expression):
                 return str(value)
             return None
-        elif role == Qt.ItemDataRole.TextAlignmentRole:
-            return Qt.AlignmentFlag.AlignCenter
-        else:
-            return super().data(index, role)
 
     def flags(self, index) -> Qt.ItemFlag:
         if not index.isValid():
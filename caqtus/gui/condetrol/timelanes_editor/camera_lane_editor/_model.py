@@ -11,6 +11,14 @@ from .._time_lane_model import TimeLaneModel
 
 _DEFAULT_INDEX = QModelIndex()
 
+_VALUE_ROLES = frozenset(
+    {
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.EditRole,
+        Qt.ItemDataRole.DecorationRole,
+    }
+)
+
 
 class CameraTimeLaneModel(TimeLaneModel[CameraTimeLane]):
     # ruff: noqa: N802
@@ -25,6 +33,12 @@ class CameraTimeLaneModel(TimeLaneModel[CameraTimeLane]):
     def data(self, index, role: int = Qt.ItemDataRole.DisplayRole):
         if not index.isValid():
             return None
+        if role not in _VALUE_ROLES:
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._brush
+            elif role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return None
         value = self.lane_value(index.row())
         if role == Qt.ItemDataRole.DisplayRole:
             if isinstance(value, TakePicture):
@@ -40,15 +54,9 @@ class CameraTimeLaneModel(TimeLaneModel[CameraTimeLane]):
                 return ""
             else:
                 assert_never(value)
-        elif role == Qt.ItemDataRole.ForegroundRole:
-            return self._brush
-        elif role == Qt.ItemDataRole.TextAlignmentRole:
-            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
         elif role == Qt.ItemDataRole.DecorationRole:
             if isinstance(value, TakePicture):
                 return self._icon
-        else:
-            return None
 
     def setData(self, index, value: Any, role: int = Qt.ItemDataRole.EditRole):
         if not index.isValid():
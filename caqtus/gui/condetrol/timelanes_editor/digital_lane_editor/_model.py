@@ -10,6 +10,15 @@ from .._colored_time_lane_model import ColoredTimeLaneModel
 
 _DEFAULT_INDEX = QModelIndex()
 
+# Roles for which the value of the lane at the requested step must be looked up.
+_VALUE_ROLES = frozenset(
+    {
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.EditRole,
+        Qt.ItemDataRole.BackgroundRole,
+    }
+)
+
 
 class DigitalTimeLaneModel(ColoredTimeLaneModel[DigitalTimeLane]):
     # ruff: noqa: N802
@@ -25,6 +34,10 @@ class DigitalTimeLaneModel(ColoredTimeLaneModel[DigitalTimeLane]):
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         if not index.isValid():
             return None
+        if role not in _VALUE_ROLES:
+            if role == Qt.ItemDataRole.TextAlignmentRole:
+                return Qt.AlignmentFlag.AlignCenter
+            return super().data(index, role)
         value = self.lane_value(index.row())
         if role == Qt.ItemDataRole.DisplayRole:
             if isinstance(value, bool):
@@ -39,10 +52,6 @@ class DigitalTimeLaneModel(ColoredTimeLaneModel[DigitalTimeLane]):
             if isinstance(value, bool):
                 if value:
                     return self._brush
-        elif role == Qt.ItemDataRole.TextAlignmentRole:
-            return Qt.AlignmentFlag.AlignCenter
-        else:
-            return super().data(index, role)
 
     def setData(self, index, value: Any, role: int = Qt.ItemDataRole.EditRole):
         if not index.isValid():
@@ -15,6 +15,9 @@ class HTMLItemDelegate(QStyledItemDelegate):
 
     def __init__(self, parent: Optional[QWidget] = None):
         self.doc = QTextDocument()
+        # sizeHint is called for every row each time the view is laid out, so it
+        # reuses the same document instead of creating a new one for each call.
+        self._size_hint_doc = QTextDocument()
         super().__init__(parent)
 
     def get_text_to_render(self, index: QModelIndex) -> str:
@@ -48,7 +51,7 @@ class HTMLItemDelegate(QStyledItemDelegate):
     def sizeHint(self, option, index):
         options = QStyleOptionViewItem(option)
         self.initStyleOption(options, index)
-        doc = QTextDocument()
+        doc = self._size_hint_doc
         doc.setHtml(options.text)
         doc.setTextWidth(options.rect.width())
         return QSize(doc.idealWidth(), doc.size().height())
@@ -1,6 +1,5 @@
 from collections.abc import Mapping, Callable
 
-import qtawesome
 from PySide6.QtWidgets import QApplication
 
 from caqtus.session import ExperimentSessionMaker
@@ -26,6 +25,8 @@ class SnapShot:
         app = QApplication.instance()
         self.session_maker = session_maker
         if app is None:
+            import qtawesome
+
             self.app = QApplication([])
             self.app.setOrganizationName("Caqtus")
             self.app.setApplicationName("Shot Viewer")
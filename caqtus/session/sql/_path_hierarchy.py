@@ -15,6 +15,7 @@ from caqtus.utils.result import (
     unwrap,
 )
 from ._path_table import SQLSequencePath
+from ._sequence_table import SQLSequence
 from .._exceptions import (
     SequenceRunningError,
     PathIsSequenceError,
@@ -275,27 +276,31 @@ def _get_children(
     | Failure[PathNotFoundError]
     | Failure[PathIsSequenceError]
 ):
-    query_result = _query_path_model(session, path)
-    if isinstance(query_result, Success):
-        path_sql = unwrap(query_result)
-        if path_sql.sequence:
-            return Failure(PathIsSequenceError(str(path)))
-        else:
-            children = path_sql.children
-    elif isinstance(query_result, Failure):
-        if is_failure_type(query_result, PathIsRootError):
-            query_children = select(SQLSequencePath).where(
-                SQLSequencePath.parent_id.is_(None)
-            )
-            children = session.scalars(query_children)
-        elif is_failure_type(query_result, PathNotFoundError):
-            return query_result
-        else:
-            assert_never(query_result)
+    if path.is_root():
+        query_children = select(SQLSequencePath.path).where(
+            SQLSequencePath.parent_id.is_(None)
+        )
     else:
-        assert_never(query_result)
+        # The parent id and whether the path is a sequence are fetched in a single
+        # query, instead of loading the path model and then its relationships.
+        query_parent = (
+            select(SQLSequencePath.id_, SQLSequence.id_)
+            .outerjoin(SQLSequence, SQLSequence.path_id == SQLSequencePath.id_)
+            .where(SQLSequencePath.path == str(path))
+        )
+        parent = session.execute(query_parent).one_or_none()
+        if parent is None:
+            return Failure(PathNotFoundError(f'Path "{path}" does not exists'))
+        parent_id, sequence_id = parent
+        if sequence_id is not None:
+            return Failure(PathIsSequenceError(str(path)))
+        query_children = select(SQLSequencePath.path).where(
+            SQLSequencePath.parent_id == parent_id
+        )
 
-    return Success(set(PureSequencePath(str(child.path)) for child in children))
+    # Only the path column is needed, so no ORM object is built for the children.
+    children = session.scalars(query_children)
+    return Success(set(PureSequencePath(child) for child in children))
 
 
 def _get_path_creation_date(
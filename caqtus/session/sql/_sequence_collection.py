@@ -720,32 +720,52 @@ def _get_stats(
     | Failure[PathNotFoundError]
     | Failure[PathIsNotSequenceError]
 ):
-    result = _query_sequence_model(session, path)
-
-    def extract_stats(sequence: SQLSequence) -> SequenceStats:
-        number_shot_query = select(func.count()).select_from(
-            select(SQLShot).where(SQLShot.sequence == sequence).subquery()
+    # The sequence and its number of shots are fetched in a single round trip to the
+    # database.
+    number_shot_query = (
+        select(func.count(SQLShot.id_))
+        .where(SQLShot.sequence_id == SQLSequence.id_)
+        .scalar_subquery()
+    )
+    # Only the columns needed for the stats are selected, so that no ORM object is
+    # built for the sequence.
+    stmt = (
+        select(
+            SQLSequence.state,
+            SQLSequence.start_time,
+            SQLSequence.stop_time,
+            SQLSequence.expected_number_of_shots,
+            number_shot_query,
         )
-        number_shot_run = session.execute(number_shot_query).scalar_one()
-        return SequenceStats(
-            state=sequence.state,
+        .join(SQLSequencePath)
+        .where(SQLSequencePath.path == str(path))
+    )
+    row = session.execute(stmt).one_or_none()
+    if row is None:
+        # We only need to know if the path exists to find out why no sequence was
+        # found.
+        path_result = _query_path_model(session, path)
+        if is_failure_type(path_result, PathNotFoundError):
+            return path_result
+        return Failure(PathIsNotSequenceError(path))
+    state, start_time, stop_time, expected_number_of_shots, number_shot_run = row
+    return Success(
+        SequenceStats(
+            state=state,
             start_time=(
-                sequence.start_time.replace(tzinfo=datetime.timezone.utc)
-                if sequence.start_time is not None
+                start_time.replace(tzinfo=datetime.timezone.utc)
+                if start_time is not None
                 else None
             ),
             stop_time=(
-                sequence.stop_time.replace(tzinfo=datetime.timezone.utc)
-                if sequence.stop_time is not None
+                stop_time.replace(tzinfo=datetime.timezone.utc)
+                if stop_time is not None
                 else None
             ),
             number_completed_shots=number_shot_run,
-            expected_number_shots=_convert_to_unknown(
-                sequence.expected_number_of_shots
-            ),
+            expected_number_shots=_convert_to_unknown(expected_number_of_shots),
         )
-
-    return result.map(extract_stats)
+    )
 
 
 def _get_sequence_global_parameters(
@@ -1,10 +1,6 @@
 from sqlite3 import Connection as SQLite3Connection
-from typing import Self
+from typing import Self, TYPE_CHECKING
 
-import alembic.command
-import alembic.config
-import alembic.migration
-import alembic.script
 import attrs
 import sqlalchemy
 import sqlalchemy.orm
@@ -21,6 +17,11 @@ from ._experiment_session import SQLExperimentSession
 from ._serializer import SerializerProtocol
 from .._session_maker import StorageManager
 
+if TYPE_CHECKING:
+    # alembic is only needed to check and upgrade the database schema, so it is
+    # imported on demand to not slow down the import of this module.
+    import alembic.config
+
 
 # We need to enable foreign key constraints for sqlite databases and not for other
 # types of databases.
@@ -94,7 +95,9 @@ class SQLStorageManager(StorageManager):
         async_engine = create_async_engine(state.pop("async_url"))
         self.__init__(state["serializer"], engine, async_engine)
 
-    def _get_alembic_config(self) -> alembic.config.Config:
+    def _get_alembic_config(self) -> "alembic.config.Config":
+        import alembic.config
+
         alembic_cfg = alembic.config.Config()
         alembic_cfg.set_main_option(
             "script_location", "caqtus:session:sql:_migration:_alembic"
@@ -113,6 +116,9 @@ class SQLStorageManager(StorageManager):
                 application schema.
         """
 
+        import alembic.migration
+        import alembic.script
+
         alembic_cfg = self._get_alembic_config()
 
         directory = alembic.script.ScriptDirectory.from_config(alembic_cfg)
@@ -144,6 +150,8 @@ class SQLStorageManager(StorageManager):
             method in case something goes wrong.
         """
 
+        import alembic.command
+
         alembic_cfg = self._get_alembic_config()
         alembic.command.upgrade(alembic_cfg, "head")
 
@@ -298,7 +298,7 @@ def evaluate_step_durations(
             )
 
         try:
-            seconds = evaluated.to_unit(SECOND).magnitude
+            seconds = evaluated.m_as(SECOND)
         except DimensionalityError as error:
             raise InvalidDimensionalityError(
                 fmt(
@@ -43,8 +43,26 @@ class VariableNamespace(Generic[T]):
         else:
             return NotImplemented
 
+    def copy(self) -> "VariableNamespace[T]":
+        """Return a copy of the namespace.
+
+        The nested namespaces are copied, so that updating the copy doesn't affect the
+        original, but the parameter values are shared as they are never mutated.
+        """
+
+        return VariableNamespace(_copy_tree(self._dict.dict()))
+
     def __repr__(self):
         return f"{self.__class__.__name__}({self._dict})"
 
     def dict(self):
         return self._dict
+
+
+def _copy_tree(tree: dict) -> dict:
+    """Copy the nested dictionaries of a tree, but not its leaves."""
+
+    return {
+        key: _copy_tree(value) if isinstance(value, dict) else value
+        for key, value in tree.items()
+    }
@@ -3,7 +3,7 @@ import contextvars
 import re
 from collections.abc import Mapping
 from functools import cached_property
-from typing import Optional, Any
+from typing import Optional, Any, cast
 
 import numpy
 import token_utils
@@ -118,7 +118,18 @@ class Expression:
             EvaluationError: if an error occurred during evaluation.
         """
 
-        return self._evaluate({str(expr): variables[expr] for expr in variables})
+        # Only the names appearing in the expression are looked up in the variables,
+        # so that the cost of the evaluation doesn't depend on the size of the context.
+        # Variable names hash and compare equal to their string, so the mapping can be
+        # indexed directly with the names found in the expression.
+        names_to_values = cast(Mapping[str, Any], variables)
+        return self._evaluate(
+            {
+                name: names_to_values[name]
+                for name in self._loaded_names
+                if name in names_to_values
+            }
+        )
 
     @cached_property
     def upstream_variables(self) -> frozenset[VariableName]:
@@ -137,6 +148,21 @@ class Expression:
         FindNameVisitor().visit(self._ast)
         return frozenset(variables)
 
+    @cached_property
+    def _loaded_names(self) -> frozenset[str]:
+        """Return all the names read by the expression, including builtins."""
+
+        try:
+            tree = self._ast
+        except SyntaxError:
+            # The error will be raised when the expression is compiled for evaluation.
+            return frozenset()
+        return frozenset(
+            node.id
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)
+        )
+
     def check_syntax(self) -> Optional[SyntaxError]:
         """Force parsing of the expression.
 
@@ -194,6 +220,14 @@ class Expression:
     def __setstate__(self, state):
         self.__init__(**state)
 
+    def __copy__(self) -> "Expression":
+        return self
+
+    def __deepcopy__(self, memo) -> "Expression":
+        # Expressions are immutable, so copies can share the same instance and keep
+        # its parsed and compiled forms instead of having to recompute them.
+        return self
+
 
 serialization.register_unstructure_hook(Expression, lambda expr: expr.body)
 serialization.register_structure_hook(Expression, lambda body, _: Expression(body))
@@ -1,5 +1,5 @@
 from collections.abc import Mapping
-from copy import deepcopy
+import copy
 from typing import Generic, TypeVar, Self, Optional
 
 from caqtus.types.variable_name import DottedVariableName
@@ -19,7 +19,9 @@ class StepContext(Generic[T]):
             self._variables.update(dict(initial_variables))
 
     def clone(self) -> Self:
-        return deepcopy(self)
+        clone = copy.copy(self)
+        clone._variables = self._variables.copy()
+        return clone
 
     def update_variable(self, name: DottedVariableName, value: T) -> Self:
         clone = self.clone()
@@ -28,4 +30,4 @@ class StepContext(Generic[T]):
 
     @property
     def variables(self) -> VariableNamespace[T]:
-        return deepcopy(self._variables)
+        return self._variables.copy()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import functools
 from collections.abc import Iterable, Callable, Generator
-from collections.abc import Mapping, Iterator
+from collections.abc import Mapping, Iterator, Sequence
 from typing import TypeAlias, TypeGuard, Any, assert_type, override, assert_never, Self
 
 import attrs
@@ -19,7 +19,7 @@ from caqtus.types.parameter import is_parameter
 from caqtus.types.recoverable_exceptions import InvalidTypeError
 from caqtus.utils import serialization
 from ._step_context import StepContext
-from .iteration_configuration import IterationConfiguration, Unknown
+from .iteration_configuration import IterationConfiguration, Unknown, is_unknown
 from ..parameter._analog_value import is_scalar_analog_value, ScalarAnalogValue
 from ..recoverable_exceptions import EvaluationError
 from ..units import (
@@ -163,7 +163,7 @@ class LinspaceLoop(ContainsSubSteps):
             raise AssertionError("start must be strictly a float or a Quantity")
         else:
             try:
-                stop = _to_unit(stop, start.units)
+                stop = _to_unit(stop, start.units, "stop")
             except DimensionalityError as e:
                 raise InvalidDimensionalityError(
                     f"Start {fmt.expression(self.start)} of {self} has invalid "
@@ -231,6 +231,39 @@ class ArangeLoop(ContainsSubSteps):
                 commensurate.
         """
 
+        magnitudes, unit = self._loop_magnitudes(evaluation_context)
+        if unit is None:
+            for value in magnitudes:
+                yield float(value)
+        else:
+            for value in magnitudes:
+                yield Quantity(float(value), unit)
+
+    def _loop_magnitudes(
+        self, evaluation_context: Mapping[DottedVariableName, Any]
+    ) -> tuple[numpy.ndarray, Unit | None]:
+        """Returns the magnitudes of the values taken by the loop variable.
+
+        The start, stop and step expressions are evaluated once and converted to the
+        unit of the start value, without building a quantity for each value.
+
+        Args:
+            evaluation_context: Contains the value of the variables with which to
+                evaluate the start, stop and step expressions of the loop.
+
+        Returns:
+            A tuple containing the magnitudes of the loop values, and the unit in which
+            they are expressed, or None if the values are dimensionless floats.
+
+        Raises:
+            EvaluationError: if the start, stop or step expressions could not be
+                evaluated.
+            NotAnalogValueError: if the start, stop or step expressions don't evaluate
+                to an analog value.
+            InvalidDimensionalityError: if the start, stop and step values are not
+                commensurate.
+        """
+
         try:
             start = _to_scalar_analog_value(self.start.evaluate(evaluation_context))
         except NotAnalogValueError:
@@ -275,30 +308,30 @@ class ArangeLoop(ContainsSubSteps):
             assert_type(start, float)
             assert_type(stop, float)
             assert_type(step, float)
-            for value in numpy.arange(start, stop, step):
-                yield float(value)
+            return numpy.arange(start, stop, step), None
         elif isinstance(start, int):
             raise AssertionError("start must be strictly a float or a Quantity")
         else:
+            unit = start.units
             try:
-                stop = _to_unit(stop, start.units)
+                stop_magnitude = _magnitude_in_unit(stop, unit, "stop")
             except DimensionalityError as e:
                 raise InvalidDimensionalityError(
                     f"Start {fmt.expression(self.start)} of {self} has invalid "
                     f"dimensionality."
                 ) from e
             try:
-                step = _to_unit(step, start.units)
+                step_magnitude = _magnitude_in_unit(step, unit, "step")
             except DimensionalityError as e:
                 raise InvalidDimensionalityError(
                     f"Step {fmt.expression(self.step)} of {self} has invalid "
                     f"dimensionality."
                 ) from e
             assert_type(start, Quantity[float])
-            assert_type(stop, Quantity[float])
-            assert_type(step, Quantity[float])
-            for value in numpy.arange(start.magnitude, stop.magnitude, step.magnitude):
-                yield Quantity(float(value), start.units)
+            return (
+                numpy.arange(start.magnitude, stop_magnitude, step_magnitude),
+                unit,
+            )
 
 
 @attrs.define
@@ -365,7 +398,7 @@ class StepsConfiguration(IterationConfiguration):
             the number of shots cannot be determined.
         """
 
-        return sum(expected_number_shots(step) for step in self.steps)
+        return _count_shots(self.steps)
 
     def get_parameter_names(self) -> set[DottedVariableName]:
         return set().union(*[get_parameter_names(step) for step in self.steps])
@@ -411,33 +444,67 @@ class StepsConfiguration(IterationConfiguration):
         )
 
 
-@functools.singledispatch
-def expected_number_shots(step: Step) -> int | Unknown:
-    raise NotImplementedError(f"Cannot determine the number of shots for {step}")
-
-
-@expected_number_shots.register
-def _(step: VariableDeclaration):
-    return 0
-
-
-@expected_number_shots.register
-def _(step: ExecuteShot):
-    return 1
+def _count_shots(steps: Sequence[Step]) -> int | Unknown:
+    """Returns the number of shots that will be executed by a list of steps.
 
+    The step tree is walked iteratively in post-order, the number of shots of a loop
+    being computed once the number of shots of its sub-steps is known.
+    This avoids a recursive call for each step of the tree.
 
-@expected_number_shots.register
-def _(step: LinspaceLoop):
-    sub_steps_number = sum(
-        expected_number_shots(sub_step) for sub_step in step.sub_steps
-    )
-    return sub_steps_number * step.num
-
+    Returns:
+        A positive integer if the number of shots can be determined, or Unknown if
+        the number of shots cannot be determined.
+    """
 
-@expected_number_shots.register
-def _(step: ArangeLoop):
+    # Steps left to visit, with a flag indicating if the sub-steps of a loop have
+    # already been counted.
+    pending: list[tuple[Step, bool]] = [(step, False) for step in reversed(steps)]
+    # Number of shots of the steps visited, that have not yet been consumed by their
+    # parent loop.
+    counts: list[int | Unknown] = []
+
+    while pending:
+        step, sub_steps_counted = pending.pop()
+        match step:
+            case ExecuteShot():
+                counts.append(1)
+            case VariableDeclaration():
+                counts.append(0)
+            case LinspaceLoop() | ArangeLoop() if not sub_steps_counted:
+                pending.append((step, True))
+                pending.extend(
+                    (sub_step, False) for sub_step in reversed(step.sub_steps)
+                )
+            case LinspaceLoop(num=num, sub_steps=sub_steps):
+                counts.append(_pop_sum(counts, len(sub_steps)) * num)
+            case ArangeLoop(sub_steps=sub_steps):
+                sub_steps_number = _pop_sum(counts, len(sub_steps))
+                length = _arange_length(step)
+                if is_unknown(length):
+                    counts.append(length)
+                else:
+                    counts.append(sub_steps_number * length)
+            case _:
+                raise NotImplementedError(
+                    f"Cannot determine the number of shots for {step}"
+                )
+
+    return sum(counts)
+
+
+def _pop_sum(counts: list[int | Unknown], number: int) -> int | Unknown:
+    """Remove the last elements of a list of counts and return their sum."""
+
+    if number == 0:
+        return 0
+    total = sum(counts[-number:])
+    del counts[-number:]
+    return total
+
+
+def _arange_length(step: ArangeLoop) -> int | Unknown:
     try:
-        length = len(list(step.loop_values({})))
+        return len(step._loop_magnitudes({})[0])
     except (EvaluationError, NotAnalogValueError, InvalidDimensionalityError):
         # The errors above can occur if the steps are still being edited or if the
         # expressions depend on other variables that are not defined here.
@@ -445,11 +512,6 @@ def _(step: ArangeLoop):
         # we just indicate that we don't know the number of shots.
         return Unknown()
 
-    sub_steps_number = sum(
-        expected_number_shots(sub_step) for sub_step in step.sub_steps
-    )
-    return sub_steps_number * length
-
 
 def get_parameter_names(step: Step) -> set[DottedVariableName]:
     match step:
@@ -641,7 +703,7 @@ def _to_dimensionless_float(value: ScalarAnalogValue) -> float:
     """
 
     if isinstance(value, Quantity):
-        return value.to_unit(dimensionless).magnitude
+        return value.m_as(dimensionless)
     elif isinstance(value, float):
         return value
     elif isinstance(value, int):
@@ -650,15 +712,39 @@ def _to_dimensionless_float(value: ScalarAnalogValue) -> float:
         assert_never(value)
 
 
-def _to_unit[U: Unit](value: ScalarAnalogValue, unit: U) -> Quantity[float, U]:
+def _to_unit[
+    U: Unit
+](value: ScalarAnalogValue, unit: U, name: str) -> Quantity[float, U]:
     """Convert a scalar analog value to the same unit as another.
 
+    Args:
+        value: The value to convert.
+        unit: The unit to convert the value to.
+        name: The name of the value, used in error messages.
+
+    Raises:
+        DimensionalityError: If the value is a quantity not commensurate with the unit.
+    """
+
+    return Quantity(_magnitude_in_unit(value, unit, name), unit)
+
+
+def _magnitude_in_unit(value: ScalarAnalogValue, unit: Unit, name: str) -> float:
+    """Return the magnitude of a scalar analog value expressed in a given unit.
+
+    Args:
+        value: The value to convert.
+        unit: The unit to express the value in.
+        name: The name of the value, used in error messages.
+
     Raises:
         DimensionalityError: If the value is a quantity not commensurate with the unit.
     """
 
     if isinstance(value, float):
+        if unit == dimensionless:
+            return value
         value = Quantity(value, dimensionless)
     elif isinstance(value, int):
-        raise AssertionError("stop must be strictly a float or a Quantity")
-    return value.to_unit(unit)
+        raise AssertionError(f"{name} must be strictly a float or a Quantity")
+    return value.m_as(unit)
@@ -109,7 +109,7 @@ class QuantityType:
     def to_polars_value(self, value) -> float:
         if not isinstance(value, Quantity):
             raise ValueError(f"Expected a Quantity, got {value!r}.")
-        magnitude = value.to_unit(self.units).magnitude
+        magnitude = value.m_as(self.units)
         if not isinstance(magnitude, float):
             raise ValueError(f"Expected a float, got {magnitude!r}.")
         return magnitude
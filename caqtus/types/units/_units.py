@@ -100,11 +100,7 @@ class Quantity(
 
     @property
     def magnitude(self) -> M:
-        mag = super().magnitude
-        if isinstance(mag, np.ndarray):
-            return mag.astype(float)  # type: ignore[reportReturnType]
-        else:
-            return float(mag)  # type: ignore[reportReturnType]
+        return _to_float_magnitude(super().magnitude)  # type: ignore[reportReturnType]
 
     def __str__(self):
         return format(self, "~")
@@ -113,6 +109,13 @@ class Quantity(
         return f"Quantity({self.magnitude}, {self.units!r})"
 
 
+def _to_float_magnitude(magnitude: SupportsFloat | np.ndarray) -> Magnitude:
+    if isinstance(magnitude, np.ndarray):
+        return magnitude.astype(float)
+    else:
+        return float(magnitude)
+
+
 def is_quantity(value) -> TypeIs[Quantity]:
     """Returns True if the value is a quantity, False otherwise."""
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Iterable
 from typing import Self, Any
 
@@ -21,11 +22,15 @@ class DottedVariableName:
 
     _dotted_name: str
     _individual_names: tuple[VariableName, ...] = attrs.field(init=False, repr=False)
+    _hash: int = attrs.field(init=False, repr=False)
 
     def __init__(self, dotted_name: str):
         names = tuple(dotted_name.split("."))
-        self._individual_names = tuple(VariableName(name) for name in names)
+        self._individual_names = tuple(_intern_variable_name(name) for name in names)
         self._dotted_name = str(dotted_name)
+        # Names are used as dictionary keys in many hot paths, so we compute the hash
+        # only once.
+        self._hash = hash(self._dotted_name)
 
     @property
     def dotted_name(self) -> str:
@@ -52,7 +57,19 @@ class DottedVariableName:
         return f"{type(self).__name__}('{self._dotted_name}')"
 
     def __hash__(self):
-        return hash(self._dotted_name)
+        return self._hash
+
+    def __reduce__(self):
+        # The hash of a string is not stable across processes, so it must not be
+        # pickled with the rest of the instance.
+        return type(self), (self._dotted_name,)
+
+    def __copy__(self) -> Self:
+        return self
+
+    def __deepcopy__(self, memo) -> Self:
+        # Instances are immutable, so they can be shared between copies.
+        return self
 
     def __eq__(self, other):
         if isinstance(other, DottedVariableName):
@@ -81,9 +98,10 @@ class VariableName(DottedVariableName):
             raise InvalidVariableNameError(f"Invalid variable name: {name}")
         self._individual_names = (self,)
         self._dotted_name = str(name)
+        self._hash = hash(self._dotted_name)
 
     def __hash__(self):
-        return super().__hash__()
+        return self._hash
 
     def __repr__(self):
         return super().__repr__()
@@ -100,6 +118,19 @@ class VariableName(DottedVariableName):
             return NotImplemented
 
 
+@functools.lru_cache(maxsize=4096)
+def _intern_variable_name(name: str) -> VariableName:
+    """Return a shared instance of a variable name.
+
+    Since variable names are immutable, the same instance can be used for all the
+    dotted names that contain it.
+    This avoids creating and validating new instances every time a dotted name is
+    built.
+    """
+
+    return VariableName(name)
+
+
 def unstructure_hook(dotted_variable_name: DottedVariableName) -> str:
     return dotted_variable_name.dotted_name
 
@@ -0,0 +1,61 @@
+import attrs
+import numpy as np
+
+from caqtus.device import DeviceName
+from caqtus.device.configuration import DeviceServerName
+from caqtus.gui.condetrol._main_window._main_window import _save_device_configurations
+from tests.test_gui.test_condetrol.mock_device_configuration import (
+    MockDeviceConfiguration,
+)
+
+
+class RecordingDict(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.written = []
+
+    def __setitem__(self, key, value):
+        self.written.append(key)
+        super().__setitem__(key, value)
+
+
+@attrs.define
+class ArrayConfiguration(MockDeviceConfiguration):
+    values: np.ndarray = attrs.field(factory=lambda: np.zeros(3))
+
+
+def test_only_changed_configurations_are_written():
+    unchanged = MockDeviceConfiguration(remote_server=DeviceServerName("default"))
+    previous = {
+        DeviceName("unchanged"): unchanged,
+        DeviceName("changed"): MockDeviceConfiguration(
+            remote_server=DeviceServerName("default")
+        ),
+        DeviceName("removed"): unchanged,
+    }
+    new = {
+        DeviceName("unchanged"): MockDeviceConfiguration(
+            remote_server=DeviceServerName("default")
+        ),
+        DeviceName("changed"): MockDeviceConfiguration(
+            remote_server=DeviceServerName("new")
+        ),
+        DeviceName("added"): unchanged,
+    }
+    stored = RecordingDict(previous)
+
+    _save_device_configurations(stored, previous, new)
+
+    assert stored.written == [DeviceName("changed"), DeviceName("added")]
+    assert stored == new
+
+
+def test_configurations_that_cant_be_compared_are_written():
+    previous = {DeviceName("device"): ArrayConfiguration(remote_server=None)}
+    new = {DeviceName("device"): ArrayConfiguration(remote_server=None)}
+    stored = RecordingDict(previous)
+
+    _save_device_configurations(stored, previous, new)
+
+    assert stored.written == [DeviceName("device")]
+    assert stored[DeviceName("device")] is new[DeviceName("device")]
@@ -2,7 +2,8 @@ import pytest
 
 from caqtus.gui.condetrol.timelanes_editor._time_lanes_model import TimeLanesModel
 from caqtus.gui.condetrol.timelanes_editor.extension import CondetrolLaneExtension
-from caqtus.types.timelane import DigitalTimeLane
+from caqtus.types.expression import Expression
+from caqtus.types.timelane import DigitalTimeLane, TimeLanes
 
 
 def test_0():
@@ -23,3 +24,34 @@ def test_1(lane_extension):
     model.insert_time_lane("lane", lane, 0)
 
     assert model.get_timelanes().lanes["lane"] == lane
+
+
+def test_lane_data_changed_is_mapped_to_lane_row(lane_extension, qtbot):
+    model = TimeLanesModel(lane_extension)
+    model.insertColumn(0)
+    model.insert_time_lane("a", DigitalTimeLane([True]))
+    model.insert_time_lane("b", DigitalTimeLane([True]), 0)
+
+    with qtbot.waitSignal(model.dataChanged) as blocker:
+        model.setData(model.index(3, 0), False)
+
+    assert blocker.args[0].row() == 3
+    assert model.get_timelanes().lanes["a"] == DigitalTimeLane([False])
+
+
+def test_lane_data_changed_after_undoable_reset(lane_extension, qtbot):
+    model = TimeLanesModel(lane_extension)
+    model.insertColumn(0)
+    model.insert_time_lane("a", DigitalTimeLane([True]))
+    model.setData(model.index(2, 0), False)
+    time_lanes = TimeLanes(
+        step_names=["step"],
+        step_durations=[Expression("1")],
+        lanes={"b": DigitalTimeLane([True]), "c": DigitalTimeLane([True])},
+    )
+    model.set_timelanes_with_undo(time_lanes, "replace")
+
+    with qtbot.waitSignal(model.dataChanged) as blocker:
+        model.setData(model.index(3, 0), False)
+
+    assert blocker.args[0].row() == 3
@@ -0,0 +1,57 @@
+import anyio
+from PySide6.QtCore import QModelIndex
+
+from caqtus.gui._common.sequence_hierarchy import AsyncPathHierarchyModel
+from caqtus.gui.qtutil import qt_trio
+from caqtus.session import PureSequencePath, PathIsSequenceError
+from caqtus.utils.result import is_success, is_failure_type
+
+
+def run_with_model(model: AsyncPathHierarchyModel, function):
+    # The model can only be edited while its background task is running.
+    results = []
+
+    async def scenario():
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(model.run)
+            await anyio.wait_all_tasks_blocked()
+            results.append(function())
+            tg.cancel_scope.cancel()
+
+    qt_trio.run(scenario)
+    return results[0]
+
+
+def test_new_folder_is_appended(session_maker, qtbot):
+    model = AsyncPathHierarchyModel(session_maker)
+    with session_maker() as session:
+        session.paths.create_path(PureSequencePath(r"\a"))
+    model.fetchMore(QModelIndex())
+
+    result = run_with_model(model, lambda: model.create_new_folder(QModelIndex(), "b"))
+
+    assert is_success(result)
+    assert [model.index(row, 0).data() for row in range(model.rowCount())] == [
+        "a",
+        "b",
+    ]
+    with session_maker() as session:
+        assert session.paths.does_path_exists(PureSequencePath(r"\b"))
+
+
+def test_new_folder_cannot_replace_sequence(
+    session_maker, steps_configuration, time_lanes, qtbot
+):
+    model = AsyncPathHierarchyModel(session_maker)
+    with session_maker() as session:
+        session.sequences.create(
+            PureSequencePath(r"\seq"), steps_configuration, time_lanes
+        )
+    model.fetchMore(QModelIndex())
+
+    result = run_with_model(
+        model, lambda: model.create_new_folder(QModelIndex(), "seq")
+    )
+
+    assert is_failure_type(result, PathIsSequenceError)
+    assert model.rowCount() == 1
@@ -0,0 +1,90 @@
+from PySide6.QtCore import QModelIndex
+
+from caqtus.gui._common.sequence_hierarchy import AsyncPathHierarchyModel
+from caqtus.gui.qtutil import qt_trio
+from caqtus.session import PureSequencePath, State
+from caqtus.types.expression import Expression
+from caqtus.types.iteration import (
+    StepsConfiguration,
+    ArangeLoop,
+    ExecuteShot,
+)
+from caqtus.types.parameter import ParameterNamespace
+from caqtus.types.variable_name import DottedVariableName
+
+
+def test_0(session_maker, steps_configuration, time_lanes, qtbot):
+    model = AsyncPathHierarchyModel(session_maker)
+    with session_maker() as session:
+        session.paths.create_path(PureSequencePath(r"\old"))
+        session.sequences.create(
+            PureSequencePath(r"\folder\seq"), steps_configuration, time_lanes
+        )
+    model.fetchMore(QModelIndex())
+    for row in range(model.rowCount()):
+        model.fetchMore(model.index(row, 0))
+
+    with session_maker() as session:
+        session.paths.delete_path(PureSequencePath(r"\old"))
+        session.paths.create_path(PureSequencePath(r"\new"))
+        session.sequences.set_preparing(
+            PureSequencePath(r"\folder\seq"), {}, ParameterNamespace.empty()
+        )
+
+    qt_trio.run(model.update_from_session)
+
+    children = {
+        model.index(row, 0).data(): model.index(row, 0)
+        for row in range(model.rowCount())
+    }
+    assert set(children) == {"folder", "new"}
+    assert model.index(0, 1, children["folder"]).data().state == State.PREPARING
+
+
+def test_unknown_number_of_shots_is_not_a_change(session_maker, time_lanes, qtbot):
+    iteration = StepsConfiguration(
+        steps=[
+            ArangeLoop(
+                variable=DottedVariableName("x"),
+                start=Expression("0"),
+                stop=Expression("n"),
+                step=Expression("1"),
+                sub_steps=[ExecuteShot()],
+            )
+        ]
+    )
+    model = AsyncPathHierarchyModel(session_maker)
+    with session_maker() as session:
+        session.sequences.create(PureSequencePath(r"\seq"), iteration, time_lanes)
+    model.fetchMore(QModelIndex())
+
+    with qtbot.assertNotEmitted(model.dataChanged):
+        qt_trio.run(model.update_stats, model.index(0, 0))
+
+
+def test_sibling_changes_are_signaled_together(
+    session_maker, steps_configuration, time_lanes, qtbot
+):
+    model = AsyncPathHierarchyModel(session_maker)
+    with session_maker() as session:
+        for name in ["a", "b"]:
+            session.sequences.create(
+                PureSequencePath(rf"\{name}"), steps_configuration, time_lanes
+            )
+    model.fetchMore(QModelIndex())
+
+    with session_maker() as session:
+        for name in ["a", "b"]:
+            session.sequences.set_preparing(
+                PureSequencePath(rf"\{name}"), {}, ParameterNamespace.empty()
+            )
+
+    emitted = []
+    model.dataChanged.connect(
+        lambda top_left, bottom_right: emitted.append(
+            (top_left.row(), bottom_right.row())
+        )
+    )
+    qt_trio.run(model.update_from_session)
+
+    assert emitted == [(0, 1)]
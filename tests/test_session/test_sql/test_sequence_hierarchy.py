@@ -9,6 +9,7 @@ from caqtus.session import (
     PathIsSequenceError,
     DataNotFoundError,
     PathNotFoundError,
+    PathIsNotSequenceError,
     StorageManager,
 )
 from caqtus.session import PureSequencePath, Sequence
@@ -22,7 +23,7 @@ from caqtus.types.parameter import ParameterNamespace, ParameterSchema
 from caqtus.types.parameter._schema import Integer, Float
 from caqtus.types.units import ureg, Quantity, Unit
 from caqtus.types.variable_name import DottedVariableName, VariableName
-from caqtus.utils.result import unwrap
+from caqtus.utils.result import unwrap, is_failure_type
 from .device_configuration import DummyConfiguration
 from ..generate_path import path
 
@@ -191,6 +192,24 @@ def test_start_date(session_maker, steps_configuration: StepsConfiguration, time
         )
 
 
+def test_stats_failures(session_maker):
+    with session_maker() as session:
+        folder = PureSequencePath(r"\folder")
+        unwrap(session.paths.create_path(folder))
+
+        assert is_failure_type(
+            session.sequences.get_stats(PureSequencePath(r"\missing")),
+            PathNotFoundError,
+        )
+        assert is_failure_type(
+            session.sequences.get_stats(folder), PathIsNotSequenceError
+        )
+        assert is_failure_type(
+            session.sequences.get_stats(PureSequencePath.root()),
+            PathIsNotSequenceError,
+        )
+
+
 def test_shot_creation(
     session_maker, steps_configuration: StepsConfiguration, time_lanes
 ):
@@ -1,4 +1,10 @@
+import copy
+
+import pytest
+
 from caqtus.types.expression import Expression, expression_builtins, DEFAULT_BUILTINS
+from caqtus.types.recoverable_exceptions import EvaluationError
+from caqtus.types.variable_name import DottedVariableName
 
 
 def test_default_builtins():
@@ -13,3 +19,19 @@ def test_builtins_override():
         assert expr.evaluate({}) == 42
     finally:
         expression_builtins.reset(token)
+
+
+def test_variable_overrides_builtin():
+    expr = Expression("pi + a")
+    assert expr.evaluate({DottedVariableName("pi"): 1, DottedVariableName("a"): 2}) == 3
+
+
+def test_syntax_error_raises_evaluation_error():
+    expr = Expression("(")
+    with pytest.raises(EvaluationError):
+        expr.evaluate({})
+
+
+def test_deepcopy_shares_instance():
+    expr = Expression("a + b")
+    assert copy.deepcopy([expr])[0] is expr
@@ -36,6 +36,53 @@ def test_number():
     assert steps.expected_number_shots() == 10
 
 
+def test_arange_number_with_units():
+    steps = StepsConfiguration(
+        steps=[
+            ArangeLoop(
+                variable=DottedVariableName("a"),
+                start=Expression("0 kHz"),
+                stop=Expression("1 kHz"),
+                step=Expression("250 Hz"),
+                sub_steps=[
+                    ExecuteShot(),
+                ],
+            ),
+        ]
+    )
+    assert steps.expected_number_shots() == 4
+
+
+def test_nested_number():
+    steps = StepsConfiguration(
+        steps=[
+            LinspaceLoop(
+                variable=DottedVariableName("a"),
+                start=Expression("0"),
+                stop=Expression("1"),
+                num=3,
+                sub_steps=[
+                    ArangeLoop(
+                        variable=DottedVariableName("b"),
+                        start=Expression("0"),
+                        stop=Expression("4"),
+                        step=Expression("1"),
+                        sub_steps=[
+                            VariableDeclaration(
+                                DottedVariableName("c"), Expression("2 * b")
+                            ),
+                            ExecuteShot(),
+                            ExecuteShot(),
+                        ],
+                    ),
+                ],
+            ),
+            ExecuteShot(),
+        ]
+    )
+    assert steps.expected_number_shots() == 3 * 4 * 2 + 1
+
+
 def test_issue_35():
     steps = StepsConfiguration(
         steps=[
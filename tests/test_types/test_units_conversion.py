@@ -8,6 +8,7 @@ from caqtus.types.units import (
     DECIBEL,
     MEGAHERTZ,
     dimensionless,
+    Unit,
 )
 
 
@@ -30,3 +31,17 @@ def test_3():
 
 def test_4():
     assert Quantity(10, dimensionless).magnitude == 10
+
+
+def test_m_as():
+    value = Quantity(10, MEGAHERTZ)
+
+    magnitude = value.m_as(Unit("kHz"))
+
+    assert isinstance(magnitude, float)
+    assert magnitude == value.to_unit(Unit("kHz")).magnitude
+
+
+def test_m_as_invalid_dimensionality():
+    with pytest.raises(DimensionalityError):
+        Quantity(10, MEGAHERTZ).m_as(dimensionless)
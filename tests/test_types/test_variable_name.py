@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from caqtus.types.variable_name import (
@@ -42,3 +44,20 @@ def test_hash():
     name = DottedVariableName("a.b.c")
 
     assert hash(name) == hash("a.b.c")
+
+
+def test_pickle():
+    name = VariableName("a")
+
+    unpickled = pickle.loads(pickle.dumps(name))
+
+    assert unpickled == name
+    assert type(unpickled) is VariableName
+    assert hash(unpickled) == hash("a")
+
+
+def test_individual_names_are_shared():
+    first = DottedVariableName("a.b")
+    second = DottedVariableName("b.a")
+
+    assert first.individual_names[0] is second.individual_names[1]
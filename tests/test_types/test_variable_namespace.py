@@ -0,0 +1,33 @@
+from caqtus.types._parameter_namespace import VariableNamespace
+from caqtus.types.iteration._step_context import StepContext
+from caqtus.types.variable_name import DottedVariableName
+
+
+def test_copy_does_not_share_nested_namespaces():
+    namespace = VariableNamespace()
+    namespace.update({DottedVariableName("a.b"): 1, DottedVariableName("c"): 2})
+
+    copy = namespace.copy()
+    copy.update({DottedVariableName("a.d"): 3})
+
+    assert copy.to_flat_dict() == {
+        DottedVariableName("a.b"): 1,
+        DottedVariableName("a.d"): 3,
+        DottedVariableName("c"): 2,
+    }
+    assert namespace.to_flat_dict() == {
+        DottedVariableName("a.b"): 1,
+        DottedVariableName("c"): 2,
+    }
+
+
+def test_update_variable_does_not_modify_context():
+    context = StepContext({DottedVariableName("a.b"): 1})
+
+    updated = context.update_variable(DottedVariableName("a.c"), 2)
+
+    assert updated.variables.to_flat_dict() == {
+        DottedVariableName("a.b"): 1,
+        DottedVariableName("a.c"): 2,
+    }
+    assert context.variables.to_flat_dict() == {DottedVariableName("a.b"): 1}